@@ -0,0 +1,27 @@
+"""Shared Azure credential helpers.
+
+DefaultAzureCredential chain discovery is slow (it probes environment
+variables, managed-identity endpoints, the CLI, and more) and each instance
+carries its own MSAL token cache and refresh timers. Clients in this package
+share one process-wide credential, and one bearer-token provider per scope,
+via the cached factories below.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import cache
+
+from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+
+
+@cache
+def shared_credential() -> DefaultAzureCredential:
+    """Return the process-wide DefaultAzureCredential singleton."""
+    return DefaultAzureCredential()
+
+
+@cache
+def shared_token_provider(scope: str) -> Callable[[], str]:
+    """Return a cached bearer-token provider for ``scope`` backed by the shared credential."""
+    return get_bearer_token_provider(shared_credential(), scope)
@@ -8,11 +8,16 @@ logic so each server module is a thin wrapper.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
@@ -22,6 +27,7 @@ from fastmcp.server.lifespan import lifespan
 
 from .foundry_client import FoundryProjectOpenAI
 from .indexer import AzureSearchIndex, SearchIndex
+from .retry import _env_float
 from .telemetry import Telemetry, emit_feedback, instrument_search, setup_telemetry
 
 logger = logging.getLogger(__name__)
@@ -77,6 +83,161 @@ VNEXT_CONFIG = ServerConfig(
 )
 
 
+# MCP logging severities (mirrors the spec ordering fastmcp uses), for
+# gating client log sends before any formatting work happens.
+_LOG_SEVERITY = {
+    "debug": 0,
+    "info": 1,
+    "notice": 2,
+    "warning": 3,
+    "error": 4,
+    "critical": 5,
+    "alert": 6,
+    "emergency": 7,
+}
+
+# Budget for the Azure search leg before the concurrently-computed local
+# results are served instead.
+_AZURE_SEARCH_TIMEOUT_S = _env_float("FOUNDRY_AZURE_SEARCH_TIMEOUT_S", 2.0)
+
+# Shared compact encoder for wire payloads. orjson (when installed) encodes
+# several times faster than stdlib json; otherwise a preconfigured
+# JSONEncoder skips json.dumps's per-call option processing. Both emit
+# compact output with non-ASCII doc titles unescaped (MCP transports are
+# UTF-8).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _compact_json(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _compact_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Mostly-constant response payloads: only the variable field goes through
+# json.dumps, instead of re-serializing the whole dict on every miss.
+_NO_RESULTS_TEMPLATE = '{{"message": "No results found", "query": {query}, "backend": "{backend}"}}'
+_FEEDBACK_RECORDED_TEMPLATE = (
+    '{{"message": "Feedback recorded", "query": {query}, '
+    '"hint": "Run scripts/build_testbench.py to convert feedback into evaluation cases"}}'
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ServerState:
+    """Immutable per-server state assembled once by the lifespan.
+
+    Stored under a single key in the lifespan context (fastmcp lifespans
+    compose by dict merge), so a tool prologue pays one dict probe and then
+    reads everything it needs via C-level slot attribute loads.
+    """
+
+    index: SearchIndex
+    navigation: dict
+    sections: dict
+    azure_index: AzureSearchIndex | None
+    embed_query: Callable[[str], list[float]] | None
+    rewrite_query: Callable[[str], str] | None
+    telemetry: Telemetry
+
+
+class SearchResultCache:
+    """Bounded LRU with TTL for serialized search responses.
+
+    Agents frequently re-issue the same query while paginating or retrying;
+    serving the serialized payload straight from memory skips the whole
+    search round trip (a network call, for the Azure backend). The TTL keeps
+    Azure results from outliving index re-ingests for long.
+    """
+
+    def __init__(self, capacity: int = 1024, ttl_s: float = 300.0):
+        self.capacity = capacity
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def key(backend: str, limit: int, query: str) -> bytes:
+        return hashlib.blake2b(f"{backend}|{limit}|{query}".encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, key: bytes, payload: str):
+        entries = self._entries
+        entries[key] = (time.monotonic() + self.ttl_s, payload)
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _section_pages(group: dict, docs: dict) -> list[dict]:
+    """Flatten one nav group into page entries, resolving titles from docs."""
+    pages: list[dict] = []
+
+    def collect(items, parent_group=""):
+        for p in items:
+            if isinstance(p, str):
+                doc = docs.get(p)
+                entry = {"path": p, "title": doc["title"] if doc else p}
+                if parent_group:
+                    entry["group"] = parent_group
+                pages.append(entry)
+            elif isinstance(p, dict) and "pages" in p:
+                collect(p["pages"], p.get("group", parent_group))
+
+    collect(group.get("pages", []))
+    return pages
+
+
+def _build_section_lookup(nav: dict, docs: dict) -> dict:
+    """Precompute section lookup structures from the navigation tree.
+
+    Both the nav and the doc index are immutable for the lifetime of the
+    server, so the per-call work list_sections/get_section used to do
+    (flattening tabs, lowercasing every group name, resolving page titles,
+    JSON-encoding the response) is done once here.
+    """
+    groups = [group for tab in nav.get("navigation", {}).get("tabs", []) for group in tab.get("groups", [])]
+    lowered = [(group["group"].lower(), group) for group in groups]
+    counts = []
+    page_counts: dict[str, int] = {}
+    pages_json: dict[str, str] = {}
+    for name, group in lowered:
+        pages = _section_pages(group, docs)
+        counts.append({"name": group["group"], "page_count": len(pages)})
+        page_counts[name] = len(pages)
+        pages_json[name] = _compact_json(pages)
+    return {
+        "groups": groups,
+        "names": [group["group"] for group in groups],
+        "lowered": lowered,
+        "by_name": dict(lowered),
+        "counts": counts,
+        # Serialized once, compact: list_sections and get_section return the
+        # same payloads every call and the consumer is a machine, not a human.
+        "counts_json": _compact_json(counts),
+        "page_counts": page_counts,
+        "pages_json": pages_json,
+    }
+
+
+# Cached: resolution stats the filesystem and the answer never changes at
+# runtime, so repeat build_server calls (both servers, test harnesses) skip
+# the env lookups and is_dir/exists syscalls after the first resolution.
+@lru_cache(maxsize=None)
 def _resolve_docs_dir(cfg: ServerConfig, project_root: Path) -> Path:
     """Find the docs directory, checking env var and common locations."""
     if env := os.environ.get(cfg.docs_dir_env):
@@ -89,6 +250,7 @@ def _resolve_docs_dir(cfg: ServerConfig, project_root: Path) -> Path:
     return candidate
 
 
+@lru_cache(maxsize=None)
 def _resolve_docs_json(cfg: ServerConfig, project_root: Path) -> Path:
     if env := os.environ.get(cfg.docs_json_env):
         return Path(env)
@@ -108,6 +270,15 @@ def build_server(cfg: ServerConfig) -> FastMCP:
     docs_dir = _resolve_docs_dir(cfg, project_root)
     docs_json = _resolve_docs_json(cfg, project_root)
 
+    # Raw docs.json text, shared between the lifespan (which parses it) and
+    # the navigation resource (which serves it verbatim) so the file is read
+    # from disk at most once.
+    _nav_text_cache: list[str | None] = [None]
+    # Decoded page text keyed by absolute file path, served by the page
+    # resource. Seeded wholesale from the search index at startup (which has
+    # already read every page) and filled lazily for anything it missed.
+    _page_text_cache: dict[str, str] = {}
+
     # --- Lifespan ---
 
     @lifespan
@@ -115,6 +286,11 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         index = SearchIndex()
         index.load_from_directory(docs_dir)
 
+        # Reuse the index's content strings (no extra copies) so resource
+        # fetches never touch the filesystem.
+        for doc_path, doc in index.docs.items():
+            _page_text_cache[str(docs_dir / f"{doc_path}.mdx")] = doc["content"]
+
         azure_index = None
         embed_query = None
         rewrite_query = None
@@ -138,7 +314,12 @@ def build_server(cfg: ServerConfig) -> FastMCP:
                 )
 
                 embed_query = foundry_client.embed_query
-                rewrite_query = foundry_client.rewrite_query_for_search
+                # The rewrite is an LLM round trip and the same raw query
+                # recurs across retried/paginated searches, so memoize it for
+                # the server's lifetime (deterministic enough for search use).
+                # Query embeddings are already cached per-query inside
+                # AzureSearchIndex.search.
+                rewrite_query = lru_cache(maxsize=1024)(foundry_client.rewrite_query_for_search)
                 logger.info("Azure AI Search hybrid mode enabled for %s", cfg.name)
             except Exception as exc:
                 if require_azure:
@@ -151,16 +332,21 @@ def build_server(cfg: ServerConfig) -> FastMCP:
 
         navigation = {}
         if docs_json.exists():
-            navigation = json.loads(docs_json.read_text())
+            raw_nav = docs_json.read_text()
+            navigation = json.loads(raw_nav)
+            _nav_text_cache[0] = raw_nav
 
         try:
             yield {
-                "index": index,
-                "navigation": navigation,
-                "azure_index": azure_index,
-                "embed_query": embed_query,
-                "rewrite_query": rewrite_query,
-                "telemetry": telemetry,
+                "state": ServerState(
+                    index=index,
+                    navigation=navigation,
+                    sections=_build_section_lookup(navigation, index.docs),
+                    azure_index=azure_index,
+                    embed_query=embed_query,
+                    rewrite_query=rewrite_query,
+                    telemetry=telemetry,
+                ),
             }
         finally:
             if foundry_client is not None:
@@ -191,44 +377,55 @@ def build_server(cfg: ServerConfig) -> FastMCP:
 
     # --- Helpers ---
 
-    async def _log(ctx: Context, level: str, msg: str):
-        if ctx.request_context is not None:
+    async def _log(ctx: Context, level: str, msg: str, *args):
+        # Callers pass %-style format strings so interpolation only happens
+        # when a client session receives the message; outside a request the
+        # stdlib logger defers it past its own level check.
+        rc = ctx.request_context
+        if rc is not None:
+            # fastmcp applies the client's requested minimum level deep in
+            # its send path; checking it here first skips the interpolation,
+            # LogData construction, and await entirely for suppressed levels.
+            session = rc.session
+            min_level = getattr(session, "_minimum_logging_level", None) or getattr(
+                getattr(session, "fastmcp", None), "client_log_level", None
+            )
+            if min_level is not None and _LOG_SEVERITY.get(level, 1) < _LOG_SEVERITY.get(min_level, 0):
+                return
             fn = getattr(ctx, level, ctx.info)
-            await fn(msg)
+            await fn(msg % args if args else msg)
         else:
-            getattr(logger, level, logger.info)(msg)
-
-    _fallback_index: list[SearchIndex | None] = [None]
-    _fallback_nav: list[dict | None] = [None]
-
-    def _get_index(ctx: Context) -> SearchIndex:
-        lc = ctx.lifespan_context
-        if "index" in lc:
-            return lc["index"]
-        if _fallback_index[0] is None:
-            _fallback_index[0] = SearchIndex()
-            _fallback_index[0].load_from_directory(docs_dir)
-        return _fallback_index[0]
-
-    def _get_nav(ctx: Context) -> dict:
-        lc = ctx.lifespan_context
-        if "navigation" in lc:
-            return lc["navigation"]
-        if _fallback_nav[0] is None:
-            _fallback_nav[0] = json.loads(docs_json.read_text()) if docs_json.exists() else {"navigation": {"tabs": []}}
-        return _fallback_nav[0]
-
-    def _get_azure_index(ctx: Context) -> AzureSearchIndex | None:
-        return ctx.lifespan_context.get("azure_index")
-
-    def _get_embed_query(ctx: Context):
-        return ctx.lifespan_context.get("embed_query")
-
-    def _get_rewrite_query(ctx: Context):
-        return ctx.lifespan_context.get("rewrite_query")
-
-    def _get_telemetry(ctx: Context) -> Telemetry:
-        return ctx.lifespan_context.get("telemetry") or Telemetry(enabled=False)
+            getattr(logger, level, logger.info)(msg, *args)
+
+    # Tool bodies resolve the full ServerState with a single lifespan_context
+    # probe; everything after that is a slot attribute read.
+    _fallback_state: list[ServerState | None] = [None]
+
+    def _state_from(ctx: Context) -> ServerState:
+        state = ctx.lifespan_context.get("state")
+        if state is not None:
+            return state
+        # No lifespan ran (direct invocation outside a server session);
+        # assemble a local-only state once and reuse it.
+        if _fallback_state[0] is None:
+            index = SearchIndex()
+            index.load_from_directory(docs_dir)
+            navigation = (
+                json.loads(docs_json.read_text()) if docs_json.exists() else {"navigation": {"tabs": []}}
+            )
+            _fallback_state[0] = ServerState(
+                index=index,
+                navigation=navigation,
+                sections=_build_section_lookup(navigation, index.docs),
+                azure_index=None,
+                embed_query=None,
+                rewrite_query=None,
+                telemetry=Telemetry(enabled=False),
+            )
+        return _fallback_state[0]
+
+    # Per-server: the docs and vnext servers must not share cached payloads.
+    _search_cache = SearchResultCache()
 
     # --- Tools ---
 
@@ -251,46 +448,91 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         Returns ranked results with path, title, description, and relevance score.
         Use the returned paths with get_doc to read the full page content.
         """
-        await _log(ctx, "info", f"Searching {cfg.name} for: {query}")
+        await _log(ctx, "info", "Searching %s for: %s", cfg.name, query)
         started = time.perf_counter()
-        telemetry = _get_telemetry(ctx)
+        state = _state_from(ctx)
+        telemetry = state.telemetry
         backend = "local"
 
-        azure_index = _get_azure_index(ctx)
-        embed_query_fn = _get_embed_query(ctx)
-        rewrite_query_fn = _get_rewrite_query(ctx)
-        effective_query = rewrite_query_fn(query) if callable(rewrite_query_fn) else query
+        azure_index = state.azure_index
+        embed_query_fn = state.embed_query
+        rewrite_query_fn = state.rewrite_query
+        # The Foundry/Azure clients are synchronous; run their network calls on
+        # worker threads so one slow search doesn't stall every other tool
+        # call on the server's event loop.
+        if callable(rewrite_query_fn):
+            effective_query = await asyncio.to_thread(rewrite_query_fn, query)
+        else:
+            effective_query = query
+
+        intended_backend = "azure-hybrid" if azure_index and embed_query_fn else "local"
+        cache_key = _search_cache.key(intended_backend, limit, effective_query)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            await _log(ctx, "info", "Serving cached results for: %s", effective_query)
+            return cached
 
         if azure_index and embed_query_fn:
-            try:
-                results = azure_index.search(query=effective_query, limit=limit, embedding_fn=embed_query_fn)
-                backend = "azure-hybrid"
-            except Exception as exc:
-                if os.environ.get("FOUNDRY_EVAL_REQUIRE_AZURE", "").casefold() in {"1", "true", "yes"}:
+            if os.environ.get("FOUNDRY_EVAL_REQUIRE_AZURE", "").casefold() in {"1", "true", "yes"}:
+                # Local fallback is forbidden, so hedging is meaningless: no
+                # local task and no timeout — a slow-but-successful Azure
+                # search must be allowed to finish.
+                try:
+                    results = await asyncio.to_thread(
+                        azure_index.search, query=effective_query, limit=limit, embedding_fn=embed_query_fn
+                    )
+                except Exception as exc:
                     raise RuntimeError(f"Azure-required search failed for {cfg.name}: {exc}") from exc
-                await _log(ctx, "warning", f"Azure search failed, falling back to local index: {exc}")
-                index: SearchIndex = _get_index(ctx)
-                results = index.search(query, limit=limit)
+                backend = "azure-hybrid"
+            else:
+                # Hedge: start the cheap local BM25 scoring alongside the
+                # Azure round trip, so a timeout or failure serves local
+                # results immediately instead of only starting the fallback
+                # after the full Azure latency has been paid.
+                local_task = asyncio.create_task(asyncio.to_thread(state.index.search, query, limit))
+                try:
+                    results = await asyncio.wait_for(
+                        asyncio.to_thread(
+                            azure_index.search, query=effective_query, limit=limit, embedding_fn=embed_query_fn
+                        ),
+                        timeout=_AZURE_SEARCH_TIMEOUT_S,
+                    )
+                    backend = "azure-hybrid"
+                    local_task.cancel()
+                except Exception as exc:
+                    await _log(ctx, "warning", "Azure search failed or timed out, serving local results: %s", exc)
+                    results = await local_task
         else:
-            index = _get_index(ctx)
-            results = index.search(query, limit=limit)
+            results = state.index.search(query, limit=limit)
 
         latency_ms = (time.perf_counter() - started) * 1000
-        instrument_search(
-            telemetry=telemetry,
-            query=effective_query,
-            result_count=len(results),
-            backend=backend,
-            latency_ms=latency_ms,
-            top_paths=[r.get("path", "") for r in results[:5]],
-        )
+        # instrument_search no-ops when disabled, but building top_paths and
+        # pushing six arguments per call is still waste; duplicate its guard
+        # here so the disabled path pays nothing.
+        if telemetry.enabled and telemetry.tracer is not None:
+            instrument_search(
+                telemetry=telemetry,
+                query=effective_query,
+                result_count=len(results),
+                backend=backend,
+                latency_ms=latency_ms,
+                top_paths=[r.get("path", "") for r in results[:5]],
+            )
 
         if not results:
-            await _log(ctx, "warning", f"No results for query: {query}")
-            return json.dumps({"message": "No results found", "query": query, "backend": backend})
-
-        await _log(ctx, "info", f"Found {len(results)} results ({backend}, {latency_ms:.1f}ms)")
-        return json.dumps(results, indent=2)
+            await _log(ctx, "warning", "No results for query: %s", query)
+            return _NO_RESULTS_TEMPLATE.format(query=json.dumps(query), backend=backend)
+
+        await _log(ctx, "info", "Found %d results (%s, %.1fms)", len(results), backend, latency_ms)
+        # Compact output: pretty-printing roughly doubles the payload and the
+        # MCP client parses it either way.
+        payload = _compact_json(results)
+        # Only cache non-empty results served by the backend the key was
+        # computed for (an Azure failure that fell back to local must not be
+        # pinned under the azure key for the TTL).
+        if backend == intended_backend:
+            _search_cache.put(cache_key, payload)
+        return payload
 
     @mcp.tool(
         tags={"feedback", "evaluation"},
@@ -310,7 +552,7 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         ctx: Context,
     ) -> str:
         """Record failed/weak search cases for testbench generation and relevance tuning."""
-        telemetry = _get_telemetry(ctx)
+        telemetry = _state_from(ctx).telemetry
         emit_feedback(
             telemetry=telemetry,
             project_root=project_root,
@@ -321,15 +563,8 @@ def build_server(cfg: ServerConfig) -> FastMCP:
             proposed_solution=proposed_solution,
         )
 
-        await _log(ctx, "info", f"Recorded search feedback event{suffix}")
-        return json.dumps(
-            {
-                "message": "Feedback recorded",
-                "query": query,
-                "hint": "Run scripts/build_testbench.py to convert feedback into evaluation cases",
-            },
-            indent=2,
-        )
+        await _log(ctx, "info", "Recorded search feedback event%s", suffix)
+        return _FEEDBACK_RECORDED_TEMPLATE.format(query=json.dumps(query))
 
     @mcp.tool(
         tags={"read", "content"},
@@ -349,20 +584,23 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         Accepts exact paths or partial filenames. Returns the full MDX content.
         Paths are returned by search_docs and get_section.
         """
-        index: SearchIndex = _get_index(ctx)
+        index = _state_from(ctx).index
 
         clean = path.lstrip("/").removesuffix(".mdx")
         if clean in index.docs:
-            await _log(ctx, "info", f"Returning doc: {clean}")
+            await _log(ctx, "info", "Returning doc: %s", clean)
             return index.docs[clean]["content"]
 
+        # O(1) partial-filename resolution via the precomputed stem index
+        # instead of a suffix scan over every indexed path.
         target = clean.split("/")[-1]
-        for doc_path in index.docs:
-            if doc_path.endswith(f"/{target}") or doc_path == target:
-                await _log(ctx, "info", f"Fuzzy matched '{path}' → '{doc_path}'")
-                return index.docs[doc_path]["content"]
+        candidates = index.stem_index.get(target)
+        if candidates:
+            doc_path = candidates[0]
+            await _log(ctx, "info", "Fuzzy matched '%s' → '%s'", path, doc_path)
+            return index.docs[doc_path]["content"]
 
-        await _log(ctx, "warning", f"Document not found: {path}")
+        await _log(ctx, "warning", "Document not found: %s", path)
         raise ValueError(
             f"Document not found: {path}. "
             "Use search_docs to find pages by keyword, or list_sections to browse."
@@ -382,24 +620,9 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         Returns the top-level table of contents: section names and how many
         pages each contains. Use get_section to drill into a specific section.
         """
-        nav = _get_nav(ctx)
-        sections = []
-
-        def count_pages(items) -> int:
-            total = 0
-            for p in items:
-                if isinstance(p, str):
-                    total += 1
-                elif isinstance(p, dict) and "pages" in p:
-                    total += count_pages(p["pages"])
-            return total
-
-        for tab in nav.get("navigation", {}).get("tabs", []):
-            for group in tab.get("groups", []):
-                sections.append({"name": group["group"], "page_count": count_pages(group.get("pages", []))})
-
-        await _log(ctx, "info", f"Returning {len(sections)} sections")
-        return json.dumps(sections, indent=2)
+        lookup = _state_from(ctx).sections
+        await _log(ctx, "info", "Returning %d sections", len(lookup["counts"]))
+        return lookup["counts_json"]
 
     @mcp.tool(
         tags={"navigation", "content"},
@@ -419,30 +642,21 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         Returns page paths and titles. Pass any path to get_doc to read the full content.
         Supports partial matching: 'agents' matches 'Foundry Agent Service'.
         """
-        nav = _get_nav(ctx)
-        index: SearchIndex = _get_index(ctx)
+        lookup = _state_from(ctx).sections
         section_lower = section.lower()
 
-        all_groups = []
-        for tab in nav.get("navigation", {}).get("tabs", []):
-            for group in tab.get("groups", []):
-                all_groups.append(group)
-
-        # Exact match, then substring, then word-prefix match
-        matched_group = None
-        for group in all_groups:
-            if group["group"].lower() == section_lower:
-                matched_group = group
-                break
+        # Exact match via the precomputed name index, then substring, then
+        # word-prefix match over the cached lowercase names.
+        matched_group = lookup["by_name"].get(section_lower)
         if matched_group is None:
-            for group in all_groups:
-                if section_lower in group["group"].lower():
+            for name, group in lookup["lowered"]:
+                if section_lower in name:
                     matched_group = group
                     break
         if matched_group is None:
             section_words = set(section_lower.split())
-            for group in all_groups:
-                group_words = set(group["group"].lower().split())
+            for name, group in lookup["lowered"]:
+                group_words = set(name.split())
                 # Match if any query word is a prefix of any group word (or vice versa)
                 if any(
                     gw.startswith(sw) or sw.startswith(gw)
@@ -453,32 +667,32 @@ def build_server(cfg: ServerConfig) -> FastMCP:
                     break
 
         if matched_group is not None:
-            pages = []
-
-            def collect_pages(items, parent_group=""):
-                for p in items:
-                    if isinstance(p, str):
-                        doc = index.docs.get(p)
-                        entry = {"path": p, "title": doc["title"] if doc else p}
-                        if parent_group:
-                            entry["group"] = parent_group
-                        pages.append(entry)
-                    elif isinstance(p, dict) and "pages" in p:
-                        collect_pages(p["pages"], p.get("group", parent_group))
-
-            collect_pages(matched_group.get("pages", []))
-            await _log(ctx, "info", f"Section '{matched_group['group']}': {len(pages)} pages")
-            return json.dumps(pages, indent=2)
-
-        available = [g["group"] for g in all_groups]
-        await _log(ctx, "warning", f"Section not found: {section}")
+            # The response for every section was serialized at startup; a hit
+            # costs two dict lookups and a string return.
+            name = matched_group["group"].lower()
+            await _log(ctx, "info", "Section '%s': %d pages", matched_group["group"], lookup["page_counts"][name])
+            return lookup["pages_json"][name]
+
+        await _log(ctx, "warning", "Section not found: %s", section)
         raise ValueError(
             f"Section not found: {section}. "
-            f"Available sections: {', '.join(available)}"
+            f"Available sections: {', '.join(lookup['names'])}"
         )
 
     # --- Resources ---
 
+    def _read_page(mdx_file: Path) -> str | None:
+        # Pages are immutable while the server runs; normally served from the
+        # startup-seeded cache, with a lazy read for anything outside it.
+        key = str(mdx_file)
+        cached = _page_text_cache.get(key)
+        if cached is None:
+            if not mdx_file.exists():
+                return None
+            cached = mdx_file.read_text(encoding="utf-8", errors="replace")
+            _page_text_cache[key] = cached
+        return cached
+
     @mcp.resource(
         f"{res_prefix}navigation",
         name=f"Navigation Structure{suffix}",
@@ -487,41 +701,32 @@ def build_server(cfg: ServerConfig) -> FastMCP:
         annotations={"readOnlyHint": True, "idempotentHint": True},
     )
     def navigation_resource() -> str:
-        if docs_json.exists():
-            return docs_json.read_text()
-        return json.dumps({"navigation": {"tabs": []}})
+        # Normally populated by the lifespan's single read of docs.json; the
+        # lazy fallback only runs when no lifespan started.
+        cached = _nav_text_cache[0]
+        if cached is None:
+            cached = docs_json.read_text() if docs_json.exists() else json.dumps({"navigation": {"tabs": []}})
+            _nav_text_cache[0] = cached
+        return cached
 
     @mcp.resource(
-        f"{res_prefix}page/{{section}}/{{page}}",
+        f"{res_prefix}page/{{path*}}",
         name=f"Documentation Page{suffix}",
         description=(
-            f"Read a documentation page by section and page name{suffix}. "
-            f"Example: {res_prefix}page/get-started/quickstart-create-foundry-resources"
-        ),
-        mime_type="text/markdown",
-        annotations={"readOnlyHint": True, "idempotentHint": True},
-    )
-    def page_resource(section: str, page: str) -> str:
-        mdx_file = docs_dir / section / f"{page}.mdx"
-        if mdx_file.exists():
-            return mdx_file.read_text(encoding="utf-8", errors="replace")
-        return f"Document not found: {section}/{page}. Use the get_doc tool for nested paths."
-
-    @mcp.resource(
-        f"{res_prefix}page/{{section}}/{{subsection}}/{{page}}",
-        name=f"Documentation Page ({cfg.name}, nested)",
-        description=(
-            f"Read a documentation page with a nested path{suffix}. "
+            f"Read a documentation page by path (any nesting depth){suffix}. "
             f"Example: {res_prefix}page/agents/development/overview"
         ),
         mime_type="text/markdown",
         annotations={"readOnlyHint": True, "idempotentHint": True},
     )
-    def nested_page_resource(section: str, subsection: str, page: str) -> str:
-        mdx_file = docs_dir / section / subsection / f"{page}.mdx"
-        if mdx_file.exists():
-            return mdx_file.read_text(encoding="utf-8", errors="replace")
-        return f"Document not found: {section}/{subsection}/{page}"
+    def page_resource(path: str) -> str:
+        # One wildcard template replaces the separate 2- and 3-segment
+        # handlers, so every depth shares the same cache and fallback path.
+        clean = path.removesuffix(".mdx")
+        text = _read_page(docs_dir / f"{clean}.mdx")
+        if text is not None:
+            return text
+        return f"Document not found: {path}. Use search_docs to find pages by keyword."
 
     # --- Prompts ---
 
@@ -3,33 +3,110 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from .indexer import extract_description, extract_title
+from .indexer import _H1_RE, _mdx_files, _parse_front_matter, _read_mdx
+
+# Compiled once at import: these run per document (or per heading/section), so
+# paying re.compile and the re module's pattern-cache lookup on every call adds
+# up across a directory of thousands of MDX files.
+_NON_SLUG_RE = re.compile(r"[^a-z0-9\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# h2-h4 markers; a tuple startswith check is much cheaper than a per-line
+# regex match when splitting million-line corpora.
+_HEADING_PREFIXES = ("## ", "### ", "#### ")
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split on sentence-ending punctuation followed by whitespace.
+
+    Behaves like ``re.split(r"(?<=[.!?])\\s+", text)`` but jumps between
+    candidate boundaries with C-level str.find calls instead of running the
+    lookbehind regex over every character of every section body. A
+    next-occurrence cursor per punctuation character is only re-found once
+    the boundary passes it, so each character's occurrences are scanned once
+    in total — without this, every boundary re-found all three characters,
+    rescanning to end-of-text for whichever were absent.
+    """
+    parts: list[str] = []
+    find = text.find
+    n = len(text)
+    start = 0
+    i = 0
+    next_dot = find(".")
+    next_bang = find("!")
+    next_question = find("?")
+    while i < n - 1:
+        if -1 < next_dot < i:
+            next_dot = find(".", i)
+        if -1 < next_bang < i:
+            next_bang = find("!", i)
+        if -1 < next_question < i:
+            next_question = find("?", i)
+        candidates = [j for j in (next_dot, next_bang, next_question) if j != -1]
+        if not candidates:
+            break
+        i = min(candidates)
+        if i + 1 < n and text[i + 1].isspace():
+            parts.append(text[start:i + 1])
+            i += 2
+            while i < n and text[i].isspace():
+                i += 1
+            start = i
+        else:
+            i += 1
+    if start < n:
+        parts.append(text[start:])
+    return parts
 
 
 def _strip_front_matter(content: str) -> str:
-    return re.sub(r"^---\n.*?---\n", "", content, flags=re.DOTALL)
+    _, _, body_offset = _parse_front_matter(content)
+    return content[body_offset:]
 
 
+@lru_cache(maxsize=4096)
 def _slugify(value: str) -> str:
+    # Headings like "Overview" or "Next steps" repeat across thousands of
+    # docs, so memoizing skips the regex work for all but the first sighting.
     lowered = value.lower().strip()
-    cleaned = re.sub(r"[^a-z0-9\s-]", "", lowered)
-    return re.sub(r"\s+", "-", cleaned).strip("-") or "section"
+    cleaned = _NON_SLUG_RE.sub("", lowered)
+    return _WHITESPACE_RE.sub("-", cleaned).strip("-") or "section"
+
+
+_b64encode = base64.urlsafe_b64encode
 
 
 def _encode_search_key(raw: str) -> str:
-    encoded = base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+    # Not cached: chunk ids are unique, so a cache would only ever miss.
+    encoded = _b64encode(raw.encode()).decode("ascii")
     return encoded.rstrip("=")
 
 
+def _hash_search_key(raw: str) -> str:
+    # Fixed-width 32-char keys: cheaper to produce than the base64 chain for
+    # long doc paths and friendlier to key-range paging. Opt-in via
+    # MarkdownChunker(key_scheme="blake2b") because switching schemes orphans
+    # every chunk_id already in an index.
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+_KEY_ENCODERS = {
+    "base64": _encode_search_key,
+    "blake2b": _hash_search_key,
+}
+
+
 def _split_with_overlap(text: str, max_chars: int, overlap: int) -> list[str]:
     if len(text) <= max_chars:
         return [text]
 
-    sentence_parts = re.split(r"(?<=[.!?])\s+", text)
+    sentence_parts = _split_sentences(text)
     chunks: list[str] = []
     current = ""
 
@@ -58,12 +135,13 @@ def _split_with_overlap(text: str, max_chars: int, overlap: int) -> list[str]:
         if len(new_current) <= max_chars:
             current = new_current
         else:
-            hard_chunks = [
-                new_current[idx: idx + max_chars]
-                for idx in range(0, len(new_current), max_chars)
-            ]
-            chunks.extend(hard_chunks[:-1])
-            current = hard_chunks[-1]
+            # Emit full-size slices directly instead of materializing an
+            # intermediate list of every hard chunk; only the tail is kept
+            # in the accumulator.
+            n_full = (len(new_current) - 1) // max_chars
+            for i in range(n_full):
+                chunks.append(new_current[i * max_chars: (i + 1) * max_chars])
+            current = new_current[n_full * max_chars:]
 
     if current:
         chunks.append(current)
@@ -71,6 +149,12 @@ def _split_with_overlap(text: str, max_chars: int, overlap: int) -> list[str]:
     return chunks
 
 
+def _content_hash(text: str) -> str:
+    # blake2b is the fastest hash in CPython's stdlib and 16 bytes is plenty
+    # for change detection (this is not a security boundary).
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @dataclass(slots=True)
 class Chunk:
     chunk_id: str
@@ -79,15 +163,20 @@ class Chunk:
     description: str
     section_heading: str
     content: str
+    content_hash: str
     char_count: int
 
 
 class MarkdownChunker:
     """Chunk MDX docs by heading structure with overlap fallback for long sections."""
 
-    def __init__(self, max_chars: int = 4000, overlap_chars: int = 400):
+    def __init__(self, max_chars: int = 4000, overlap_chars: int = 400, key_scheme: str = "base64"):
+        if key_scheme not in _KEY_ENCODERS:
+            raise ValueError(f"Unknown key_scheme: {key_scheme!r} (expected one of {sorted(_KEY_ENCODERS)})")
         self.max_chars = max_chars
         self.overlap_chars = overlap_chars
+        self.key_scheme = key_scheme
+        self._encode_key = _KEY_ENCODERS[key_scheme]
 
     def _split_by_headings(self, body: str) -> list[tuple[str, str]]:
         lines = body.splitlines()
@@ -96,10 +185,10 @@ class MarkdownChunker:
         current_lines: list[str] = []
 
         for line in lines:
-            if re.match(r"^#{2,4}\s+", line):
+            if line.startswith(_HEADING_PREFIXES):
                 if current_lines:
                     sections.append((current_heading, current_lines))
-                current_heading = re.sub(r"^#{2,4}\s+", "", line).strip() or "Introduction"
+                current_heading = line.lstrip("#").strip() or "Introduction"
                 current_lines = [line]
             else:
                 current_lines.append(line)
@@ -107,14 +196,21 @@ class MarkdownChunker:
         if current_lines:
             sections.append((current_heading, current_lines))
 
-        return [(heading, "\n".join(block).strip()) for heading, block in sections if "\n".join(block).strip()]
-
-    def chunk(self, doc_path: str, raw_mdx: str) -> list[Chunk]:
-        title = extract_title(raw_mdx) or doc_path.split("/")[-1]
-        description = extract_description(raw_mdx)
-        body = _strip_front_matter(raw_mdx)
+        out: list[tuple[str, str]] = []
+        for heading, block in sections:
+            joined = "\n".join(block).strip()
+            if joined:
+                out.append((heading, joined))
+        return out
+
+    def _iter_pieces(self, doc_path: str, raw_mdx: str):
+        """Yield (chunk_id, title, description, heading, text) tuples for a doc."""
+        title, description, body_offset = _parse_front_matter(raw_mdx)
+        body = raw_mdx[body_offset:]
+        if not title:
+            h1 = _H1_RE.search(body)
+            title = h1.group(1).strip() if h1 else doc_path.split("/")[-1]
 
-        all_chunks: list[Chunk] = []
         for section_index, (heading, section_text) in enumerate(self._split_by_headings(body)):
             prefixed = f"{title} > {heading}\n\n{section_text}".strip()
             chunks = _split_with_overlap(prefixed, self.max_chars, self.overlap_chars)
@@ -122,27 +218,78 @@ class MarkdownChunker:
 
             for split_index, chunk_text in enumerate(chunks):
                 raw_chunk_id = f"{doc_path}#{heading_slug}#{section_index}-{split_index}"
-                chunk_id = _encode_search_key(raw_chunk_id)
-                all_chunks.append(
-                    Chunk(
-                        chunk_id=chunk_id,
-                        doc_path=doc_path,
-                        title=title,
-                        description=description,
-                        section_heading=heading,
-                        content=chunk_text,
-                        char_count=len(chunk_text),
-                    )
-                )
-
-        return all_chunks
-
-
-def chunk_directory(docs_dir: Path, chunker: MarkdownChunker | None = None) -> list[Chunk]:
+                yield self._encode_key(raw_chunk_id), title, description, heading, chunk_text
+
+    def chunk(self, doc_path: str, raw_mdx: str) -> list[Chunk]:
+        return [
+            Chunk(
+                chunk_id=chunk_id,
+                doc_path=doc_path,
+                title=title,
+                description=description,
+                section_heading=heading,
+                content=chunk_text,
+                content_hash=_content_hash(chunk_text),
+                char_count=len(chunk_text),
+            )
+            for chunk_id, title, description, heading, chunk_text in self._iter_pieces(doc_path, raw_mdx)
+        ]
+
+    def chunk_records(self, doc_path: str, raw_mdx: str) -> list[dict]:
+        """Like chunk(), but emits upload-shaped dicts directly.
+
+        The Azure ingest path immediately coerces every Chunk into a dict for
+        upload_chunks, so building the dicts here skips one dataclass
+        allocation per chunk (tens of thousands per full corpus).
+        """
+        return [
+            {
+                "chunk_id": chunk_id,
+                "doc_path": doc_path,
+                "content_hash": _content_hash(chunk_text),
+                "title": title,
+                "section_heading": heading,
+                "description": description,
+                "content": chunk_text,
+            }
+            for chunk_id, title, description, heading, chunk_text in self._iter_pieces(doc_path, raw_mdx)
+        ]
+
+
+# Below this many files the fork/pickle overhead of a process pool outweighs
+# the parallel speedup, so small trees (and unit tests) stay serial.
+_PARALLEL_MIN_FILES = 32
+
+
+def _chunk_file_task(args: tuple[str, str, int, int, str, bool]) -> list[Chunk] | list[dict]:
+    """Process-pool worker: read one MDX file and chunk it."""
+    doc_path, file_path, max_chars, overlap_chars, key_scheme, as_records = args
+    chunker = MarkdownChunker(max_chars, overlap_chars, key_scheme)
+    method = chunker.chunk_records if as_records else chunker.chunk
+    return method(doc_path=doc_path, raw_mdx=_read_mdx(file_path))
+
+
+def chunk_directory(
+    docs_dir: Path,
+    chunker: MarkdownChunker | None = None,
+    as_records: bool = False,
+) -> list[Chunk] | list[dict]:
     chunker = chunker or MarkdownChunker()
-    chunks: list[Chunk] = []
-    for mdx_file in sorted(docs_dir.rglob("*.mdx")):
-        doc_path = mdx_file.relative_to(docs_dir).with_suffix("").as_posix()
-        raw = mdx_file.read_text(encoding="utf-8", errors="replace")
-        chunks.extend(chunker.chunk(doc_path=doc_path, raw_mdx=raw))
+    tasks = [
+        (doc_path, file_path, chunker.max_chars, chunker.overlap_chars, chunker.key_scheme, as_records)
+        for doc_path, file_path in _mdx_files(docs_dir)
+    ]
+
+    chunks: list = []
+    if len(tasks) < _PARALLEL_MIN_FILES:
+        method = chunker.chunk_records if as_records else chunker.chunk
+        for doc_path, file_path, *_ in tasks:
+            chunks.extend(method(doc_path=doc_path, raw_mdx=_read_mdx(file_path)))
+        return chunks
+
+    # The per-file regex and slicing work is CPU-bound and independent, so it
+    # parallelizes across cores; results merge in task order.
+    with ProcessPoolExecutor() as executor:
+        for file_chunks in executor.map(_chunk_file_task, tasks, chunksize=16):
+            chunks.extend(file_chunks)
     return chunks
\ No newline at end of file
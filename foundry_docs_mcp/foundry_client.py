@@ -12,9 +12,10 @@ from urllib.parse import urlparse
 from typing import Any
 
 from azure.ai.projects import AIProjectClient
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+from azure.identity import DefaultAzureCredential
 from openai import OpenAI
 
+from ._azure_common import shared_credential, shared_token_provider
 from .retry import with_retry
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ class FoundryProjectOpenAI:
         if self._project_openai_client is not None and self._embedding_openai_client is not None:
             return
 
-        self._credential = DefaultAzureCredential()
+        self._credential = shared_credential()
         self._project_client = AIProjectClient(
             endpoint=self.project_endpoint,
             credential=self._credential,
@@ -60,10 +61,7 @@ class FoundryProjectOpenAI:
         if self.api_key:
             auth_value = self.api_key
         else:
-            auth_value = get_bearer_token_provider(
-                self._credential,
-                "https://cognitiveservices.azure.com/.default",
-            )
+            auth_value = shared_token_provider("https://cognitiveservices.azure.com/.default")
 
         self._embedding_openai_client = OpenAI(
             base_url=self._cognitiveservices_base_url_from_project_endpoint(self.project_endpoint),
@@ -71,11 +69,12 @@ class FoundryProjectOpenAI:
         )
 
     def close(self):
+        # The credential is the process-wide shared instance and is
+        # intentionally left open for other clients.
         for client in (
             self._project_openai_client,
             self._embedding_openai_client,
             self._project_client,
-            self._credential,
         ):
             if client is None:
                 continue
@@ -3,15 +3,17 @@
 Builds a TF-IDF-like search index from MDX docs for fast full-text search.
 """
 
+import heapq
 import math
+import os
 import re
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
-from collections import Counter, defaultdict
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import Counter, OrderedDict, defaultdict
 from collections.abc import Callable
 from pathlib import Path
 
 from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential
 from azure.search.documents import SearchClient
 from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
@@ -32,6 +34,7 @@ from azure.search.documents.indexes.models import (
 )
 from azure.search.documents.models import QueryType, VectorizedQuery
 
+from ._azure_common import shared_credential
 from .retry import AdaptiveThrottle, with_retry
 
 # Common English function words filtered out of both documents and queries.
@@ -49,23 +52,74 @@ STOPWORDS = frozenset({
 })
 
 
+# Compiled once at import: tokenize/extract_* run for every document added to
+# the index (and tokenize again for every query), so per-call re.compile and
+# pattern-cache lookups are pure overhead on the indexing hot path.
+_TAG_RE = re.compile(r'<[^>]+>')
+_CODEBLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+# Code fences and MDX/HTML tags to skip during tokenization, in one pattern so
+# tokenize needs a single scan instead of two substitution passes.
+_SKIP_RE = re.compile(r'```.*?```|<[^>]+>', re.DOTALL)
+_TOKEN_RE = re.compile(r'[a-z0-9]+(?:[-_][a-z0-9]+)*')
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_MD_PUNCT_RE = re.compile(r'[#*_`~]')
+
+
+def _parse_front_matter(content: str) -> tuple[str, str, int]:
+    """Parse YAML front matter in a single pass.
+
+    Returns ``(title, description, body_offset)`` where ``body_offset`` is the
+    index of the first character after the closing ``---`` delimiter (0 when
+    there is no front matter). Front matter is typically under 1 KB while doc
+    bodies run 10-100 KB, so scanning only the header once is far cheaper than
+    the three whole-document DOTALL regex matches it replaces.
+    """
+    if not content.startswith("---\n"):
+        return "", "", 0
+    end = content.find("\n---\n", 3)
+    if end == -1:
+        return "", "", 0
+
+    title = ""
+    description = ""
+    for line in content[4:end].split("\n"):
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip()
+        if key == "title" and not title:
+            title = value.strip().strip('"')
+        elif key == "description" and not description:
+            description = value.strip().strip('"')
+    return title, description, end + 5
+
+
 def tokenize(text: str) -> list[str]:
-    """Simple tokenizer: lowercase, split on non-alphanumeric, filter short/stop tokens."""
+    """Simple tokenizer: lowercase, split on non-alphanumeric, filter short/stop tokens.
+
+    Tags and code fences are skipped via span bookkeeping rather than two
+    re.sub passes, so no intermediate copies of the (often 10-100 KB) text
+    are allocated.
+    """
     text = text.lower()
-    # Remove MDX/HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
-    # Remove code blocks
-    text = re.sub(r'```.*?```', ' ', text, flags=re.DOTALL)
-    tokens = re.findall(r'[a-z0-9]+(?:[-_][a-z0-9]+)*', text)
+    tokens: list[str] = []
+    findall = _TOKEN_RE.findall
+    pos = 0
+    for skip in _SKIP_RE.finditer(text):
+        if skip.start() > pos:
+            tokens += findall(text, pos, skip.start())
+        pos = skip.end()
+    tokens += findall(text, pos)
     return [t for t in tokens if len(t) > 1 and t not in STOPWORDS]
 
 
 def extract_title(content: str) -> str:
     """Extract title from front matter or first heading."""
-    fm = re.match(r'^---\n.*?title:\s*"?([^"\n]+)"?\n.*?---', content, re.DOTALL)
-    if fm:
-        return fm.group(1).strip()
-    h1 = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    title, _, _ = _parse_front_matter(content)
+    if title:
+        return title
+    h1 = _H1_RE.search(content)
     if h1:
         return h1.group(1).strip()
     return ""
@@ -73,22 +127,79 @@ def extract_title(content: str) -> str:
 
 def extract_description(content: str) -> str:
     """Extract description from front matter."""
-    fm = re.match(r'^---\n.*?description:\s*"?([^"\n]+)"?\n.*?---', content, re.DOTALL)
-    if fm:
-        return fm.group(1).strip()
-    return ""
+    _, description, _ = _parse_front_matter(content)
+    return description
 
 
 def strip_mdx_markup(content: str) -> str:
     """Strip MDX/HTML markup for plain text extraction."""
-    text = re.sub(r'^---\n.*?---\n', '', content, flags=re.DOTALL)
-    text = re.sub(r'<[^>]+>', ' ', text)
-    text = re.sub(r'```.*?```', ' ', text, flags=re.DOTALL)
-    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
-    text = re.sub(r'[#*_`~]', '', text)
+    _, _, body_offset = _parse_front_matter(content)
+    text = content[body_offset:]
+    text = _TAG_RE.sub(' ', text)
+    text = _CODEBLOCK_RE.sub(' ', text)
+    text = _LINK_RE.sub(r'\1', text)
+    text = _MD_PUNCT_RE.sub('', text)
     return text
 
 
+def _analyze_doc(content: str) -> tuple[str, str, Counter, int]:
+    """CPU-bound per-document analysis: front matter, markup stripping, tokenization.
+
+    Separated from SearchIndex.add_doc so load_from_directory can farm it out
+    to a process pool and merge the results serially.
+    """
+    title, description, body_offset = _parse_front_matter(content)
+    if not title:
+        h1 = _H1_RE.search(content)
+        title = h1.group(1).strip() if h1 else ""
+    plain = strip_mdx_markup(content[body_offset:])
+    tokens = tokenize(f"{title} {title} {description} {plain}")  # title weighted 2x
+    return title, description, Counter(tokens), len(tokens)
+
+
+def _read_mdx(file_path: str) -> str:
+    """Read a file as bytes and decode once (cheaper than Path.read_text)."""
+    with open(file_path, "rb") as f:
+        return f.read().decode("utf-8", "replace")
+
+
+def _mdx_files(docs_dir: Path) -> list[tuple[str, str]]:
+    """Return sorted (doc_path, file_path) pairs for every .mdx under docs_dir.
+
+    Uses os.scandir recursion, which reuses directory-entry type information
+    instead of the per-path stat that Path.rglob filtering pays, and skips
+    Path object construction for every file.
+    """
+    root = str(docs_dir)
+    prefix_len = len(os.path.join(root, ""))
+    suffix_len = len(".mdx")
+    pairs: list[tuple[str, str]] = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".mdx"):
+                    doc_path = entry.path[prefix_len:-suffix_len].replace(os.sep, "/")
+                    pairs.append((doc_path, entry.path))
+    pairs.sort()
+    return pairs
+
+
+def _load_doc_task(args: tuple[str, str]) -> tuple[str, str, str, str, Counter, int]:
+    """Process-pool worker: read and analyze one MDX file."""
+    path, file_path = args
+    content = _read_mdx(file_path)
+    title, description, token_counts, token_count = _analyze_doc(content)
+    return path, content, title, description, token_counts, token_count
+
+
+# Below this many files the process-pool startup/pickle overhead outweighs the
+# parallel speedup, so small trees (and unit tests) stay serial.
+_PARALLEL_MIN_FILES = 32
+
+
 class SearchIndex:
     """BM25 search index for docs.
 
@@ -110,59 +221,102 @@ class SearchIndex:
         self.doc_freq: dict[str, int] = defaultdict(int)
         self.total_docs = 0
         self.avg_doc_len = 0.0
+        # token → list of (path, freq) posting pairs, built in build(). Scoring
+        # walks only the postings for the query terms instead of probing every
+        # document's token Counter, so query cost scales with the number of
+        # matching documents rather than with corpus size.
+        self._postings: dict[str, list[tuple[str, int]]] = {}
+        # path → K1 * length_norm, precomputed in build() so the scoring loop
+        # does one add and one divide per posting instead of rederiving the
+        # document-length normalization each time.
+        self._k1_length_norm: dict[str, float] = {}
+        # filename stem → full paths, built in build(). Lets get_doc resolve
+        # partial filenames with one dict lookup instead of scanning (and
+        # f-string-suffixing) every indexed path on each miss.
+        self.stem_index: dict[str, list[str]] = {}
 
     def add_doc(self, path: str, content: str):
         """Add a document to the index."""
-        title = extract_title(content)
-        description = extract_description(content)
-        plain = strip_mdx_markup(content)
-        tokens = tokenize(f"{title} {title} {description} {plain}")  # title weighted 2x
-        token_counts = Counter(tokens)
+        title, description, token_counts, token_count = _analyze_doc(content)
+        self._insert_doc(path, content, title, description, token_counts, token_count)
+
+    def _insert_doc(
+        self,
+        path: str,
+        content: str,
+        title: str,
+        description: str,
+        token_counts: Counter,
+        token_count: int,
+    ):
+        """Merge one analyzed document into the index structures."""
+        # Intern token strings: the same ~10k vocabulary words recur in every
+        # document's Counter (and arrive as fresh copies from process-pool
+        # workers), so sharing one object per word cuts resident memory and
+        # lets later dict lookups short-circuit on identity.
+        intern = sys.intern
+        token_counts = Counter({intern(token): count for token, count in token_counts.items()})
 
         self.docs[path] = {
             "title": title,
             "description": description,
             "content": content,
             "tokens": token_counts,
-            "token_count": len(tokens),
+            "token_count": token_count,
         }
 
-        for token in set(tokens):
-            self.doc_freq[token] += 1
+        doc_freq = self.doc_freq  # avoid attribute lookup per unique token
+        for token in token_counts:
+            doc_freq[token] += 1
 
         self.total_docs += 1
 
     def build(self):
-        """Compute BM25 IDF scores and average document length after all docs are added."""
+        """Compute BM25 IDF scores, average document length, and posting lists."""
         for token, df in self.doc_freq.items():
             self.idf[token] = math.log((self.total_docs - df + 0.5) / (df + 0.5) + 1)
         total_tokens = sum(doc["token_count"] for doc in self.docs.values())
         self.avg_doc_len = total_tokens / max(self.total_docs, 1)
 
+        postings: dict[str, list[tuple[str, int]]] = {}
+        avg_len = max(self.avg_doc_len, 1)
+        k1_length_norm: dict[str, float] = {}
+        stem_index: dict[str, list[str]] = {}
+        for path, doc in self.docs.items():
+            k1_length_norm[path] = self.K1 * (1 - self.B + self.B * (doc["token_count"] / avg_len))
+            stem_index.setdefault(path.rsplit("/", 1)[-1], []).append(path)
+            for token, freq in doc["tokens"].items():
+                postings.setdefault(token, []).append((path, freq))
+        self._postings = postings
+        self._k1_length_norm = k1_length_norm
+        self.stem_index = stem_index
+
     def search(self, query: str, limit: int = 10) -> list[dict]:
         """Search for docs matching the query using Okapi BM25."""
         query_tokens = tokenize(query)
         if not query_tokens:
             return []
 
-        avg_len = max(self.avg_doc_len, 1)
-        scores = {}
-        for path, doc in self.docs.items():
-            score = 0.0
-            doc_len = doc["token_count"]
-            length_norm = 1 - self.B + self.B * (doc_len / avg_len)
-            for qt in query_tokens:
-                freq = doc["tokens"].get(qt, 0)
-                if freq == 0:
-                    continue
-                idf = self.idf.get(qt, 0)
-                numerator = freq * (self.K1 + 1)
-                denominator = freq + self.K1 * length_norm
-                score += idf * (numerator / denominator)
-            if score > 0:
-                scores[path] = score
-
-        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        # Term-at-a-time scoring over posting lists: the inner loop runs once
+        # per (query term, matching doc) pair, not per (query term, doc) pair.
+        k1_plus1 = self.K1 + 1
+        k1_norm = self._k1_length_norm
+        postings_get = self._postings.get
+        idf_get = self.idf.get
+        scores: dict[str, float] = {}
+        scores_get = scores.get
+        for qt in query_tokens:
+            posting = postings_get(qt)
+            if not posting:
+                continue
+            idf_k1_plus1 = idf_get(qt, 0) * k1_plus1
+            for path, freq in posting:
+                contribution = idf_k1_plus1 * freq / (freq + k1_norm[path])
+                scores[path] = scores_get(path, 0.0) + contribution
+
+        # Top-k selection instead of sorting every scored doc; limit is
+        # typically 10-20 while the candidate set can be the whole corpus.
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda x: x[1])
         results = []
         for path, score in ranked:
             doc = self.docs[path]
@@ -176,10 +330,19 @@ class SearchIndex:
 
     def load_from_directory(self, docs_dir: Path):
         """Load all MDX files from a directory into the index."""
-        for mdx_file in sorted(docs_dir.rglob("*.mdx")):
-            path = mdx_file.relative_to(docs_dir).with_suffix("").as_posix()
-            content = mdx_file.read_text(encoding="utf-8", errors="replace")
-            self.add_doc(path, content)
+        tasks = _mdx_files(docs_dir)
+
+        if len(tasks) < _PARALLEL_MIN_FILES:
+            for path, file_path in tasks:
+                self.add_doc(path, _read_mdx(file_path))
+        else:
+            # Per-file analysis is CPU-bound and independent; only the cheap
+            # merge into docs/doc_freq has to stay single-threaded.
+            with ProcessPoolExecutor() as executor:
+                for path, content, title, description, token_counts, token_count in executor.map(
+                    _load_doc_task, tasks, chunksize=16
+                ):
+                    self._insert_doc(path, content, title, description, token_counts, token_count)
         self.build()
 
 
@@ -188,6 +351,11 @@ class AzureSearchIndex:
     """Azure AI Search hybrid index for chunk-level semantic retrieval."""
 
     SYNONYM_MAP_NAME = "foundry-synonyms"
+
+    # Query embeddings kept for repeated searches; agents frequently re-issue
+    # the same query within a session, and the embedding round trip is the
+    # serial prefix of every hybrid search.
+    _QUERY_VECTOR_CACHE_SIZE = 256
     SYNONYM_RULES = "\n".join([
         "rate limit, throttle, quota, rate limiting, throttling, 429",
         "safety, guardrails, content filter, content filtering, harm",
@@ -209,17 +377,19 @@ class AzureSearchIndex:
         index_name: str = "foundry-docs",
         api_key: str | None = None,
     ):
-        credential = AzureKeyCredential(api_key) if api_key else DefaultAzureCredential()
+        credential = AzureKeyCredential(api_key) if api_key else shared_credential()
         self.endpoint = endpoint
         self.index_name = index_name
         self.index_client = SearchIndexClient(endpoint=endpoint, credential=credential)
         self.search_client = SearchClient(endpoint=endpoint, index_name=index_name, credential=credential)
+        self._query_vector_cache: OrderedDict[str, list[float]] = OrderedDict()
 
     def _schema(self) -> AzureSearchSchema:
         return AzureSearchSchema(
             name=self.index_name,
             fields=[
-                SimpleField(name="chunk_id", type=SearchFieldDataType.String, key=True),
+                # filterable/sortable so metadata listing can page by key range.
+                SimpleField(name="chunk_id", type=SearchFieldDataType.String, key=True, filterable=True, sortable=True),
                 SimpleField(name="doc_path", type=SearchFieldDataType.String, filterable=True),
                 SimpleField(name="content_hash", type=SearchFieldDataType.String, filterable=True),
                 SearchableField(
@@ -298,18 +468,24 @@ class AzureSearchIndex:
             operation="search_create_or_update_index",
         )
 
-    def _process_upload_batch(
+    def _embed_batch(
         self,
         batch: list[dict],
         embedding_fn: Callable[[list[str]], list[list[float]]],
         throttle: AdaptiveThrottle,
-    ):
-        vectors = with_retry(
+    ) -> list[list[float]]:
+        return with_retry(
             lambda: embedding_fn([item["content"] for item in batch]),
             operation="search_embed_batch",
             throttle=throttle,
         )
 
+    def _upload_batch(
+        self,
+        batch: list[dict],
+        vectors: list[list[float]],
+        throttle: AdaptiveThrottle,
+    ):
         docs = []
         for item, vector in zip(batch, vectors):
             docs.append(
@@ -331,16 +507,40 @@ class AzureSearchIndex:
             throttle=throttle,
         )
 
+    def _process_upload_batch(
+        self,
+        batch: list[dict],
+        embedding_fn: Callable[[list[str]], list[list[float]]],
+        throttle: AdaptiveThrottle,
+    ):
+        vectors = self._embed_batch(batch, embedding_fn, throttle)
+        self._upload_batch(batch, vectors, throttle)
+
     def upload_chunks(
         self,
         chunks: list[dict],
         embedding_fn: Callable[[list[str]], list[list[float]]],
         batch_size: int = 100,
         max_concurrency: int = 1,
+        skip_unchanged: bool = False,
     ):
         if not chunks:
             return
 
+        if skip_unchanged:
+            # Re-embedding is the expensive step, so drop chunks whose content
+            # hash already matches what the index holds. Callers that diff
+            # up front (ingest script) leave this off to avoid a second
+            # metadata listing.
+            existing = self.get_existing_chunk_metadata()
+            chunks = [
+                chunk for chunk in chunks
+                if not chunk.get("content_hash")
+                or existing.get(chunk["chunk_id"], {}).get("content_hash") != chunk["content_hash"]
+            ]
+            if not chunks:
+                return
+
         batches: list[list[dict]] = []
         for start in range(0, len(chunks), batch_size):
             batches.append(chunks[start: start + batch_size])
@@ -348,8 +548,18 @@ class AzureSearchIndex:
         throttle = AdaptiveThrottle()
         worker_count = max(1, max_concurrency)
         if worker_count == 1:
-            for batch in batches:
-                self._process_upload_batch(batch, embedding_fn=embedding_fn, throttle=throttle)
+            # Even single-worker runs can overlap the next batch's embedding
+            # round trip with the current batch's upload: prefetch the next
+            # embedding on a background thread while this thread uploads.
+            with ThreadPoolExecutor(max_workers=1) as embed_pool:
+                next_vectors = embed_pool.submit(self._embed_batch, batches[0], embedding_fn, throttle)
+                for index, batch in enumerate(batches):
+                    vectors = next_vectors.result()
+                    if index + 1 < len(batches):
+                        next_vectors = embed_pool.submit(
+                            self._embed_batch, batches[index + 1], embedding_fn, throttle
+                        )
+                    self._upload_batch(batch, vectors, throttle)
             return
 
         in_flight_limit = worker_count * 2
@@ -374,18 +584,27 @@ class AzureSearchIndex:
                 future.result()
 
     def get_existing_chunk_metadata(self) -> dict[str, dict]:
-        """Return existing chunk metadata keyed by chunk_id."""
+        """Return existing chunk metadata keyed by chunk_id.
+
+        Pages by key range (order by chunk_id, filter past the last key seen)
+        rather than $skip: Azure Search evaluates skip in O(skip) and caps it
+        at 100k documents, so skip-paging degrades then fails outright on
+        large indexes. Chunk ids are base64url so they never need escaping in
+        the filter expression.
+        """
         rows: dict[str, dict] = {}
         page_size = 1000
-        skip = 0
+        last_key = ""
         while True:
+            filter_expr = f"chunk_id gt '{last_key}'" if last_key else None
             page = with_retry(
                 lambda: list(
                     self.search_client.search(
                         search_text="*",
                         select=["chunk_id", "doc_path", "content_hash"],
                         top=page_size,
-                        skip=skip,
+                        order_by=["chunk_id asc"],
+                        filter=filter_expr,
                     )
                 ),
                 operation="search_list_chunk_metadata",
@@ -402,29 +621,57 @@ class AzureSearchIndex:
                     "content_hash": item.get("content_hash", ""),
                 }
 
-            if len(page) < page_size:
+            new_last = page[-1].get("chunk_id", "")
+            if len(page) < page_size or not new_last or new_last == last_key:
                 break
-            skip += page_size
+            last_key = new_last
         return rows
 
-    def delete_chunks(self, chunk_ids: list[str], batch_size: int = 500):
-        """Delete chunks by key from the index."""
+    def delete_chunks(self, chunk_ids: list[str], batch_size: int = 500, max_concurrency: int = 8):
+        """Delete chunks by key from the index, issuing batches concurrently."""
         if not chunk_ids:
             return
-        for start in range(0, len(chunk_ids), batch_size):
-            batch = chunk_ids[start: start + batch_size]
+
+        batches = [chunk_ids[start: start + batch_size] for start in range(0, len(chunk_ids), batch_size)]
+        throttle = AdaptiveThrottle()
+
+        def _delete_batch(batch: list[str]):
             with_retry(
                 lambda: self.search_client.delete_documents([{"chunk_id": chunk_id} for chunk_id in batch]),
                 operation="search_delete_documents",
+                throttle=throttle,
             )
 
+        if len(batches) == 1:
+            _delete_batch(batches[0])
+            return
+
+        # Deletes are independent, so large reconciliations shouldn't pay one
+        # round trip per batch serially; the shared throttle still backs all
+        # workers off together after a 429.
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+            for _ in executor.map(_delete_batch, batches):
+                pass
+
     def search(
         self,
         query: str,
         limit: int,
         embedding_fn: Callable[[str], list[float]],
     ) -> list[dict]:
-        query_vector = embedding_fn(query)
+        # The text and vector legs are fused (RRF + semantic reranking) inside
+        # the service, so the embedding cannot overlap the search call; caching
+        # repeated query vectors is what removes the serial round trip.
+        cache = self._query_vector_cache
+        query_vector = cache.get(query)
+        if query_vector is None:
+            query_vector = embedding_fn(query)
+            cache[query] = query_vector
+            if len(cache) > self._QUERY_VECTOR_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(query)
+
         vector_query = VectorizedQuery(vector=query_vector, fields="content_vector", k_nearest_neighbors=30)
         results = with_retry(
             lambda: self.search_client.search(
@@ -458,5 +705,4 @@ class AzureSearchIndex:
             if doc_path not in best_by_doc or score > best_by_doc[doc_path]["score"]:
                 best_by_doc[doc_path] = record
 
-        ranked = sorted(best_by_doc.values(), key=lambda x: x["score"], reverse=True)
-        return ranked[:limit]
+        return heapq.nlargest(limit, best_by_doc.values(), key=lambda x: x["score"])
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import calendar
 import logging
 import os
 import random
-import threading
+import re
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import TypeVar
@@ -19,25 +20,50 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Bound once at import: these run inside the throttle/retry hot loops, where a
+# direct function reference skips the module attribute lookup on every call.
+_monotonic = time.monotonic
+_sleep = time.sleep
+_random = random.random
+_uniform = random.uniform
+
 
 class AdaptiveThrottle:
-    """Shared throttle gate for concurrent workers after rate-limit signals."""
+    """Shared throttle gate for concurrent workers after rate-limit signals.
+
+    Lock-free: the only shared mutable state is ``_next_allowed_at``, a float
+    that only ever moves forward, and under CPython's GIL a float attribute
+    read/write is atomic. Racing pausers are last-writer-wins; the worst case
+    is a marginally shorter pause than intended, which is safe. Anything added
+    here must preserve that monotonic-only invariant.
+    """
 
     def __init__(self):
         self.enabled = os.environ.get("FOUNDRY_ADAPTIVE_THROTTLE_ENABLED", "1") != "0"
         self.max_pause_s = _env_float("FOUNDRY_ADAPTIVE_THROTTLE_MAX_PAUSE_S", 60.0)
         self._next_allowed_at = 0.0
-        self._lock = threading.Lock()
+        self._consecutive_pauses = 0
 
     def wait(self):
         if not self.enabled:
             return
+        slept = False
         while True:
-            with self._lock:
-                delay = self._next_allowed_at - time.monotonic()
+            # The common no-throttle case costs one atomic float load.
+            delay = self._next_allowed_at - _monotonic()
             if delay <= 0:
-                return
-            time.sleep(min(delay, 0.5))
+                break
+            slept = True
+            _sleep(min(delay, 0.5))
+
+        if slept:
+            # Every worker blocked on the same deadline would otherwise wake
+            # and re-fire in the same instant, re-triggering the 429 that
+            # paused them. A small random stagger spreads the release.
+            _sleep(_uniform(0.0, min(0.05, self.max_pause_s * 0.01)))
+        elif self._consecutive_pauses:
+            # Passing through without sleeping means the backpressure cleared.
+            self._consecutive_pauses = 0
 
     def pause(self, seconds: float):
         if not self.enabled:
@@ -45,31 +71,48 @@ class AdaptiveThrottle:
         capped = max(0.0, min(seconds, self.max_pause_s))
         if capped <= 0:
             return
-        with self._lock:
-            now = time.monotonic()
-            target = now + capped
-            if target > self._next_allowed_at:
-                self._next_allowed_at = target
+        # Repeated pauses without a clean pass-through mean the server is
+        # still shedding load; back off multiplicatively (capped) rather
+        # than re-pausing for the same interval every time. A lost increment
+        # under a race just softens the backoff slightly.
+        self._consecutive_pauses += 1
+        factor = min(4.0, 1.0 + 0.5 * (self._consecutive_pauses - 1))
+        capped = min(capped * factor, self.max_pause_s)
+        target = _monotonic() + capped
+        if target > self._next_allowed_at:
+            self._next_allowed_at = target
+
+
+# Validate-then-convert: raising and unwinding ValueError for a malformed env
+# var costs an order of magnitude more than a pattern check, and the malformed
+# case should be as cheap as the valid one.
+_INT_RE = re.compile(r"\s*[-+]?\d+\s*$")
+_FLOAT_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$")
 
 
 def _env_int(name: str, default: int) -> int:
     raw = os.environ.get(name)
-    if raw is None:
-        return default
-    try:
-        return int(raw)
-    except ValueError:
+    if raw is None or not _INT_RE.match(raw):
         return default
+    return int(raw)
 
 
 def _env_float(name: str, default: float) -> float:
     raw = os.environ.get(name)
-    if raw is None:
-        return default
-    try:
-        return float(raw)
-    except ValueError:
+    if raw is None or not _FLOAT_RE.match(raw):
         return default
+    return float(raw)
+
+
+# with_retry defaults resolved once at import: these env vars are deployment
+# configuration, and re-reading os.environ plus reparsing on every call adds
+# four dict lookups and string conversions to each retried operation.
+# AdaptiveThrottle still reads its env vars per instance, since instances are
+# long-lived and construction-time configuration is part of its contract.
+_DEFAULT_MAX_ATTEMPTS = _env_int("FOUNDRY_RETRY_MAX_ATTEMPTS", 5)
+_DEFAULT_BASE_DELAY_S = _env_float("FOUNDRY_RETRY_BASE_DELAY_S", 0.5)
+_DEFAULT_MAX_DELAY_S = _env_float("FOUNDRY_RETRY_MAX_DELAY_S", 8.0)
+_DEFAULT_JITTER_RATIO = _env_float("FOUNDRY_RETRY_JITTER_RATIO", 0.2)
 
 
 def _retryable_status(status_code: int | None) -> bool:
@@ -78,12 +121,34 @@ def _retryable_status(status_code: int | None) -> bool:
     return status_code in {408, 409, 423, 425, 429} or status_code >= 500
 
 
+# RFC 7231 IMF-fixdate, the format servers are required to send in
+# Retry-After. Parsing it directly avoids the rfc822 parser chain and the
+# datetime/tzinfo allocations of parsedate_to_datetime on every 429.
+_HTTP_DATE_RE = re.compile(r"[A-Za-z]{3}, (\d{2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT$")
+_MONTH_NUM = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+
 def _parse_retry_after_value(raw: str) -> float | None:
     raw = (raw or "").strip()
     if not raw:
         return None
     if raw.isdigit():
         return float(raw)
+
+    fixdate = _HTTP_DATE_RE.match(raw)
+    if fixdate:
+        day, mon, year, hour, minute, second = fixdate.groups()
+        month = _MONTH_NUM.get(mon.lower())
+        if month:
+            epoch = calendar.timegm(
+                (int(year), month, int(day), int(hour), int(minute), int(second), 0, 0, 0)
+            )
+            return max(0.0, epoch - time.time())
+
+    # Last-ditch fallback for legacy date formats (RFC 850, asctime).
     try:
         dt = parsedate_to_datetime(raw)
         if dt.tzinfo is None:
@@ -94,30 +159,56 @@ def _parse_retry_after_value(raw: str) -> float | None:
         return None
 
 
+_RETRY_AFTER_UNSET = object()
+
+
 def retry_after_seconds(exc: Exception) -> float | None:
-    """Extract server-requested retry delay in seconds when available."""
-    response = getattr(exc, "response", None)
-    if response is None:
-        return None
+    """Extract server-requested retry delay in seconds when available.
+
+    The result (including a None miss) is cached on the exception itself, so
+    re-inspecting the same exception — e.g. once for the backoff delay and
+    again by an outer handler — skips the header parse.
+    """
+    cached = getattr(exc, "_cached_retry_after", _RETRY_AFTER_UNSET)
+    if cached is not _RETRY_AFTER_UNSET:
+        return cached
+
+    retry_after = None
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers:
+        retry_after = _parse_retry_after_value(headers.get("retry-after", ""))
+        if retry_after is None:
+            retry_after_ms = headers.get("x-ms-retry-after-ms")
+            if retry_after_ms:
+                try:
+                    retry_after = max(0.0, float(retry_after_ms) / 1000.0)
+                except ValueError:
+                    retry_after = None
 
-    headers = getattr(response, "headers", None)
-    if not headers:
-        return None
+    try:
+        exc._cached_retry_after = retry_after
+    except AttributeError:
+        pass  # __slots__-based exceptions can't be annotated; just recompute
+    return retry_after
 
-    retry_after = _parse_retry_after_value(headers.get("retry-after", ""))
-    if retry_after is not None:
-        return retry_after
 
-    retry_after_ms = headers.get("x-ms-retry-after-ms")
-    if retry_after_ms:
-        try:
-            return max(0.0, float(retry_after_ms) / 1000.0)
-        except ValueError:
-            return None
-    return None
+# Exact types that are always retryable, for an O(1) classification of the
+# overwhelmingly common concrete exceptions before falling back to the
+# isinstance chain (which walks each tuple and the exception's MRO).
+_ALWAYS_RETRY_TYPES = frozenset({
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+    ServiceRequestError,
+    ServiceResponseError,
+})
 
 
 def is_retryable_exception(exc: Exception) -> bool:
+    if type(exc) in _ALWAYS_RETRY_TYPES:
+        return True
+
     if isinstance(exc, (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)):
         return True
 
@@ -148,14 +239,18 @@ def with_retry(
     throttle: AdaptiveThrottle | None = None,
 ) -> T:
     """Execute an operation with exponential backoff + jitter on transient errors."""
-    max_attempts = max_attempts or _env_int("FOUNDRY_RETRY_MAX_ATTEMPTS", 5)
-    base_delay_s = base_delay_s or _env_float("FOUNDRY_RETRY_BASE_DELAY_S", 0.5)
-    max_delay_s = max_delay_s or _env_float("FOUNDRY_RETRY_MAX_DELAY_S", 8.0)
-    jitter_ratio = jitter_ratio if jitter_ratio is not None else _env_float("FOUNDRY_RETRY_JITTER_RATIO", 0.2)
+    max_attempts = max_attempts or _DEFAULT_MAX_ATTEMPTS
+    base_delay_s = base_delay_s or _DEFAULT_BASE_DELAY_S
+    max_delay_s = max_delay_s or _DEFAULT_MAX_DELAY_S
+    jitter_ratio = jitter_ratio if jitter_ratio is not None else _DEFAULT_JITTER_RATIO
 
     if max_attempts < 1:
         max_attempts = 1
 
+    # Capped exponential schedule materialized once per call; attempts are
+    # bounded and small, so this also keeps the pow out of the retry loop.
+    delays = tuple(min(base_delay_s * (1 << i), max_delay_s) for i in range(max_attempts))
+
     attempt = 1
     while True:
         try:
@@ -167,21 +262,97 @@ def with_retry(
             if not retryable or attempt >= max_attempts:
                 raise
 
-            delay = min(base_delay_s * (2 ** (attempt - 1)), max_delay_s)
+            delay = delays[attempt - 1]
             retry_after = retry_after_seconds(exc)
             if retry_after is not None:
                 delay = max(delay, retry_after)
-            jitter = delay * jitter_ratio * random.random()
+            jitter = delay * jitter_ratio * _random()
             sleep_s = min(delay + jitter, max_delay_s)
             if throttle is not None:
                 throttle.pause(sleep_s)
+            # %-formatting is already lazy, but under heavy 429 pressure with
+            # warnings filtered out even assembling the five arguments is
+            # wasted work, so gate on the effective level first.
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Retrying %s after attempt %s/%s due to %s; sleeping %.2fs",
+                    operation,
+                    attempt,
+                    max_attempts,
+                    type(exc).__name__,
+                    sleep_s,
+                )
+            _sleep(sleep_s)
+            attempt += 1
+
+
+def with_retry_many(
+    fns: Sequence[Callable[[], T]],
+    *,
+    operation: str,
+    max_attempts: int | None = None,
+    base_delay_s: float | None = None,
+    max_delay_s: float | None = None,
+    jitter_ratio: float | None = None,
+    throttle: AdaptiveThrottle | None = None,
+) -> list[T]:
+    """Run a batch of independent operations, retrying only the failures.
+
+    Amortizes the per-operation overhead of with_retry across the batch: the
+    throttle gate is checked once per attempt round rather than once per
+    operation, and a single backoff sleep covers every operation that failed
+    in that round. Results are returned in input order.
+    """
+    max_attempts = max_attempts or _DEFAULT_MAX_ATTEMPTS
+    base_delay_s = base_delay_s or _DEFAULT_BASE_DELAY_S
+    max_delay_s = max_delay_s or _DEFAULT_MAX_DELAY_S
+    jitter_ratio = jitter_ratio if jitter_ratio is not None else _DEFAULT_JITTER_RATIO
+
+    if max_attempts < 1:
+        max_attempts = 1
+
+    delays = tuple(min(base_delay_s * (1 << i), max_delay_s) for i in range(max_attempts))
+
+    results: list[T] = [None] * len(fns)  # type: ignore[list-item]
+    pending = list(range(len(fns)))
+    attempt = 1
+    while True:
+        if throttle is not None:
+            throttle.wait()
+
+        failed: list[int] = []
+        last_exc: Exception | None = None
+        for i in pending:
+            try:
+                results[i] = fns[i]()
+            except Exception as exc:
+                if not is_retryable_exception(exc) or attempt >= max_attempts:
+                    raise
+                failed.append(i)
+                last_exc = exc
+
+        if not failed:
+            return results
+
+        delay = delays[attempt - 1]
+        retry_after = retry_after_seconds(last_exc)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        jitter = delay * jitter_ratio * _random()
+        sleep_s = min(delay + jitter, max_delay_s)
+        if throttle is not None:
+            throttle.pause(sleep_s)
+        if logger.isEnabledFor(logging.WARNING):
             logger.warning(
-                "Retrying %s after attempt %s/%s due to %s; sleeping %.2fs",
+                "Retrying %s/%s %s operations after attempt %s/%s due to %s; sleeping %.2fs",
+                len(failed),
+                len(fns),
                 operation,
                 attempt,
                 max_attempts,
-                type(exc).__name__,
+                type(last_exc).__name__,
                 sleep_s,
             )
-            time.sleep(sleep_s)
-            attempt += 1
+        _sleep(sleep_s)
+        pending = failed
+        attempt += 1
@@ -6,10 +6,11 @@ and always appends feedback events to a local JSONL file for testbench use.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Any
 
@@ -81,13 +82,49 @@ def setup_telemetry(service_name: str = "foundry-docs") -> Telemetry:
         return Telemetry(enabled=False)
 
 
-def _append_feedback_jsonl(project_root: Path, payload: dict[str, Any]):
-    telemetry_dir = project_root / "telemetry"
-    telemetry_dir.mkdir(parents=True, exist_ok=True)
-    sink = telemetry_dir / "feedback.jsonl"
-    with sink.open("a", encoding="utf-8") as handle:
+class _FeedbackWriter:
+    """Persistent line-buffered handle for the feedback JSONL sink.
+
+    Appending one event used to cost mkdir + open + write + close per call.
+    The handle is opened lazily on first use (creating the directory once,
+    keyed by project root) and reused for the process lifetime; line
+    buffering still flushes each event so build_testbench.py never reads a
+    partial line.
+    """
+
+    def __init__(self):
+        self._handles: dict[str, Any] = {}
+
+    def write(self, project_root: Path, payload: dict[str, Any]):
+        key = str(project_root)
+        handle = self._handles.get(key)
+        if handle is None:
+            telemetry_dir = project_root / "telemetry"
+            telemetry_dir.mkdir(parents=True, exist_ok=True)
+            handle = (telemetry_dir / "feedback.jsonl").open("a", buffering=1, encoding="utf-8")
+            self._handles[key] = handle
         handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
 
+    def close(self):
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+
+_feedback_writer = _FeedbackWriter()
+atexit.register(_feedback_writer.close)
+
+
+def _iso_now() -> str:
+    """UTC timestamp matching datetime.isoformat() output, minus the
+    per-call datetime/tzinfo object construction."""
+    t = time.time()
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(t))}.{int(t % 1 * 1e6):06d}+00:00"
+
+
+def _append_feedback_jsonl(project_root: Path, payload: dict[str, Any]):
+    _feedback_writer.write(project_root, payload)
+
 
 def instrument_search(
     telemetry: Telemetry,
@@ -121,7 +158,7 @@ def emit_feedback(
 ):
     payload = {
         "event": "SearchFeedback",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _iso_now(),
         "user_request": user_request,
         "query": query,
         "result_paths": result_paths,
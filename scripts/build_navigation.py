@@ -14,10 +14,35 @@ import json
 import sys
 from pathlib import Path
 
+# orjson parses large manifests several times faster than stdlib json;
+# fall back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PUBLIC_UPSTREAM_URL = "https://github.com/MicrosoftDocs/azure-ai-docs"
 
 
-def _build_tree(pages: list, docs_dir: Path) -> dict:
+def _load_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def _existing_mdx_paths(docs_dir: Path) -> set[str]:
+    """Collect extension-less output paths for every .mdx under docs_dir.
+
+    One directory walk replaces a stat syscall per manifest page, so
+    existence checks during tree building become O(1) set lookups.
+    """
+    return {
+        p.relative_to(docs_dir).with_suffix("").as_posix()
+        for p in docs_dir.rglob("*.mdx")
+    }
+
+
+def _build_tree(pages: list, existing_mdx: set[str]) -> dict:
     """Build an ordered tree from flat pages with hierarchy arrays.
 
     Each node has:
@@ -35,8 +60,7 @@ def _build_tree(pages: list, docs_dir: Path) -> dict:
         if not output_path:
             continue
 
-        mdx_path = docs_dir / f"{output_path}.mdx"
-        if not mdx_path.exists():
+        if output_path not in existing_mdx:
             print(f"  WARN: skipping {output_path} (no MDX file)", file=sys.stderr)
             continue
 
@@ -93,7 +117,7 @@ def _tree_to_nav(node: dict) -> list:
     return result
 
 
-def build_nav_group(section: dict, docs_dir: Path) -> dict | None:
+def build_nav_group(section: dict, existing_mdx: set[str]) -> dict | None:
     """Build a Mintlify navigation group from a TOC section."""
     name = section.get("name", "")
     pages = section.get("pages", [])
@@ -101,7 +125,7 @@ def build_nav_group(section: dict, docs_dir: Path) -> dict | None:
     if not pages:
         return None
 
-    tree = _build_tree(pages, docs_dir)
+    tree = _build_tree(pages, existing_mdx)
     nav_pages = _tree_to_nav(tree)
 
     if not nav_pages:
@@ -136,25 +160,24 @@ def main():
     docs_dir = Path(args.docs_dir)
     docs_json_path = docs_dir / "docs.json"
 
-    manifest = json.load(open(args.manifest))
+    manifest = _load_json(Path(args.manifest))
 
     # Build navigation groups from manifest hierarchy
+    existing_mdx = _existing_mdx_paths(docs_dir)
     navigation = []
     for section in manifest.get("toc_hierarchy", []):
-        group = build_nav_group(section, docs_dir)
+        group = build_nav_group(section, existing_mdx)
         if group:
             # Inject SDK & API Reference page into API & SDK section
             if group["group"] == "API & SDK":
                 ref_page = "api-sdk/sdk-api-reference"
-                ref_mdx = docs_dir / f"{ref_page}.mdx"
-                if ref_mdx.exists() and ref_page not in group["pages"]:
+                if ref_page in existing_mdx and ref_page not in group["pages"]:
                     group["pages"].append(ref_page)
             navigation.append(group)
 
     # Merge into existing docs.json template if it exists
     if docs_json_path.exists():
-        with open(docs_json_path) as f:
-            docs_json = json.load(f)
+        docs_json = _load_json(docs_json_path)
         # Replace just the navigation groups
         docs_json["navigation"] = {
             "tabs": [{"tab": "Documentation", "groups": navigation}]
@@ -179,9 +202,10 @@ def main():
             },
         }
 
-    with open(docs_json_path, "w") as f:
-        json.dump(docs_json, f, indent=2)
-        f.write("\n")
+    if orjson is not None:
+        docs_json_path.write_bytes(orjson.dumps(docs_json, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        docs_json_path.write_text(json.dumps(docs_json, indent=2) + "\n")
 
     total_pages = sum(_count_pages(g.get("pages", [])) for g in navigation)
     print(
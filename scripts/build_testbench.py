@@ -4,17 +4,37 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
+# orjson parses each JSONL line ~3x faster than stdlib json; fall back
+# to json when it isn't installed.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 FEEDBACK_FILE = PROJECT_ROOT / "telemetry" / "feedback.jsonl"
 OUTPUT_FILE = PROJECT_ROOT / "tests" / "search_testbench.json"
 
 
+_PREFIX = "docs/"
+_PLEN = len(_PREFIX)
+
+
+@lru_cache(maxsize=4096)
 def _normalize_expected_path(value: str) -> str:
-    path = value.strip().lstrip("/")
-    if path.startswith("docs/"):
-        path = path[len("docs/"):]
+    # Called once per feedback line; expected paths repeat heavily, so the
+    # lru_cache turns most calls into a single dict hit. The slicing below
+    # avoids lstrip("/")'s per-call character-class scan.
+    path = value.strip()
+    if path.startswith("/"):
+        path = path[1:]
+    if path.startswith(_PREFIX):
+        path = path[_PLEN:]
     if path.endswith(".mdx"):
         path = path[:-4]
     return path
@@ -27,23 +47,23 @@ def main():
     cases = {}
     with FEEDBACK_FILE.open("r", encoding="utf-8") as handle:
         for line in handle:
-            raw = line.strip()
-            if not raw:
+            if not line.strip():
                 continue
-            event = json.loads(raw)
+            event = _loads(line)
             query = event.get("query", "").strip()
             expected = event.get("expected_result", "").strip()
             if not query or not expected:
                 continue
             expected = _normalize_expected_path(expected)
-            key = (query, expected)
-            if key not in cases:
-                cases[key] = {
+            cases.setdefault(
+                (query, expected),
+                {
                     "user_request": event.get("user_request", ""),
                     "query": query,
                     "expected_paths": [expected],
                     "min_results": 1,
-                }
+                },
+            )
 
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     payload = list(cases.values())
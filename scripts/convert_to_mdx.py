@@ -8,27 +8,181 @@ tabs, images, zone pivots, link rewriting, code includes, and YML FAQ docs.
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 
 import yaml
 
+# orjson parses the manifest several times faster than stdlib json; fall
+# back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 RAW_DIR = Path("raw_docs")
 DOCS_DIR = Path("docs")
 ZONE_PIVOT_GROUPS_PATH = RAW_DIR / "zone-pivots" / "zone-pivot-groups.yml"
 
-# Load manifest and path map
-MANIFEST = json.load(open("manifest.json"))
-PATH_MAP = json.load(open("path_map.json"))
 
-# Build reverse lookup: source_path → output_path
-SOURCE_TO_OUTPUT = {}
-for doc in MANIFEST["docs"]:
-    if doc["category"] == "in-repo-md" and "output_path" in doc:
-        SOURCE_TO_OUTPUT[doc["source_path"]] = doc["output_path"]
+def _load_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
 
 
+# Load manifest and path map
+MANIFEST = _load_json(Path("manifest.json"))
+PATH_MAP = _load_json(Path("path_map.json"))
+
+# Reverse lookup: source_path → output_path
+SOURCE_TO_OUTPUT = {
+    doc["source_path"]: doc["output_path"]
+    for doc in MANIFEST["docs"]
+    if doc["category"] == "in-repo-md" and "output_path" in doc
+}
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+#
+# Every converter below runs over hundreds of documents, and several fire
+# dozens of patterns per document. Compiling once at module load skips the
+# re module's per-call cache probe and pattern re-parsing on every sub/match.
+# ---------------------------------------------------------------------------
+
+# Front matter / includes. The front-matter patterns use DOTALL '.*?', so a
+# document missing its closing '---' would make the engine scan to EOF;
+# matching against a bounded head keeps that worst case O(8K), and real
+# front matter never comes close to the limit.
+_FRONT_MATTER_SCAN_BYTES = 8192
+_INCLUDE_FM_RE = re.compile(r'^---\s*\n.*?\n---\s*\n', re.DOTALL)
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_INCLUDE_RE = re.compile(r'\[!INCLUDE\s+\[([^\]]*)\]\(([^)]+)\)\]')
+
+# Callouts and blockquote [!div] blocks
+_CALLOUT_RE = re.compile(
+    r'^([ \t]*)>\s*\[!(TIP|NOTE|WARNING|IMPORTANT|CAUTION)\]\s*\n((?:\1>.*\n?)*)',
+    re.IGNORECASE | re.MULTILINE,
+)
+_BQ_MARKER_RE = re.compile(r'^>\s?')
+_BQ_MARKER_ML_RE = re.compile(r'^>\s?', re.MULTILINE)
+# One alternation covers every [!div class="..."] blockquote form; the
+# replacement callback dispatches on the captured class name.
+_DIV_CLASS_RE = re.compile(
+    r'>\s*\[!div\s+class="(nextstepaction|checklist|op_single_selector|'
+    r'op_multi_selector|mx-td)[^\]]*\]\s*\n((?:>.*\n?)*)'
+)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_SELECTOR_LINK_RE = re.compile(r'^-\s*\[([^\]]+)\]\(([^)]+)\)')
+
+# Rows/columns
+_ROW_RE = re.compile(r':::row:::\s*\n(.*?):::row-end:::\s*\n?', re.DOTALL)
+_COLUMN_SPLIT_RE = re.compile(r':::column[^:]*:::\s*\n?')
+_COLUMN_END_RE = re.compile(r':::column-end:::\s*\n?')
+
+# Tables
+_TABLE_DELIM_ROW_RE = re.compile(r'^(\s*)\|(.+)\|\s*$')
+_TABLE_HEADER_ROW_RE = re.compile(r'^\s*\|(.+)\|\s*$')
+_TABLE_DELIM_CELL_RE = re.compile(r'^:?-{3,}:?$')
+
+# Images
+_COMPLEX_IMAGE_RE = re.compile(r':::image\s+(.*?):::\s*\n(.*?):::image-end:::', re.DOTALL)
+_IMAGE_RE = re.compile(r':::image[^:]*?:::', re.DOTALL)
+_IMG_TYPE_RE = re.compile(r'type="([^"]+)"')
+_IMG_SOURCE_RE = re.compile(r'source="([^"]+)"')
+_IMG_ALT_RE = re.compile(r'alt-text="([^"]+)"')
+_QUERY_STRING_RE = re.compile(r'\?.*$')
+_MD_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_HTML_IMG_SRC_RE = re.compile(r'(<img\s[^>]*src=")([^"]+)(")')
+
+# Tabs and zone pivots
+_TAB_HEADER_RE = re.compile(r'^#{1,6}\s+\[([^\]]+)\]\(#tab/([^)]+)\)\s*$')
+_JSX_BOUNDARY_RE = re.compile(r'\s*</?(?:Tab|Tabs|ZonePivot|ZoneContent)\b')
+_ZONE_START_RE = re.compile(r':::\s*zone\s+pivot="([^"]+)"\s*$')
+_ZONE_END_RE = re.compile(r':::\s*zone-end\s*$')
+_GROUP_ID_RE = re.compile(r'[^a-zA-Z0-9_-]+')
+
+# Links
+_LINK_RE = re.compile(r'(?<!!)\[([^\]]*)\]\(([^)]+)\)')
+_CROSS_REPO_RE = re.compile(r'^(?:\.\./)+(?:foundry-classic|ai-foundry|foundry)/(.*?)\.md$')
+_MD_EXT_RE = re.compile(r'\.md$')
+
+# Code includes
+_CODE_DIRECTIVE_RE = re.compile(
+    # Length-bounded attribute tail: an unbounded [^:]* would let a directive
+    # missing its closing ':::' drag the scan deep into the document.
+    r'^([ \t]*):::code\s+language="(\w+)"\s+source="([^"]+)"(?:\s+[^:]{0,200})?:*',
+    re.MULTILINE,
+)
+_CODE_INCLUDE_RE = re.compile(r'\[!code-(\w+)\[.*?\]\(([^)]+)\)\]')
+
+# HTML comments / void elements / tables-with-HTML
+_HTML_COMMENT_RE = re.compile(r'<!--(.*?)-->', re.DOTALL)
+_JSX_TAG_RE = re.compile(r'</?[A-Z][a-zA-Z]*[^>]*/?>')
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_BR_CLOSE_RE = re.compile(r'</br\s*>', re.IGNORECASE)
+_HR_RE = re.compile(r'<hr\s*/?>', re.IGNORECASE)
+_HR_CLOSE_RE = re.compile(r'</hr\s*>', re.IGNORECASE)
+_SUP_SELF_CLOSE_RE = re.compile(r'<sup\s*/>', re.IGNORECASE)
+_VOID_PROBE_RE = re.compile(r'</?(?:br|hr)\b|<sup\s*/>', re.IGNORECASE)
+_UL_BLOCK_RE = re.compile(r'<ul>\s*(?:<li>.*?</li>\s*)+</ul>', re.IGNORECASE)
+_LI_ITEM_RE = re.compile(r'<li>(.*?)</li>', re.DOTALL)
+_UL_TAG_RE = re.compile(r'</?ul>', re.IGNORECASE)
+_LI_OPEN_RE = re.compile(r'<li>', re.IGNORECASE)
+_LI_CLOSE_RE = re.compile(r'</li>', re.IGNORECASE)
+_OL_TAG_RE = re.compile(r'</?ol>', re.IGNORECASE)
+_FRAME_OPEN_WS_RE = re.compile(r'<Frame[^>]*>\s*', re.IGNORECASE)
+_FRAME_CLOSE_WS_RE = re.compile(r'\s*</Frame>', re.IGNORECASE)
+_FRAME_OPEN_RE = re.compile(r'<Frame[^>]*>', re.IGNORECASE)
+_FRAME_CLOSE_RE = re.compile(r'</Frame>', re.IGNORECASE)
+
+# Tabs → CodeGroup
+_TABS_BLOCK_RE = re.compile(r'<Tabs>\s*(.*?)\s*</Tabs>', re.DOTALL)
+_TAB_ITEM_RE = re.compile(r'<Tab\s+title="([^"]+)">(.*?)</Tab>', re.DOTALL)
+_FENCE_FIND_RE = re.compile(r'(```\w*[^\n]*\n.*?```)', re.DOTALL)
+_FENCE_STRIP_RE = re.compile(r'```[\w]*[^\n]*\n.*?```', re.DOTALL)
+_FENCE_LANG_RE = re.compile(r'^```(\w+)(.*)')
+
+# MDX escaping
+_INLINE_CODE_SPLIT_RE = re.compile(r'(`[^`]+`)')
+_AUTOLINK_RE = re.compile(r'(?<!\\)<(https?://[^>]+)>')
+_BARE_LT_RE = re.compile(r'(?<!\\)<')
+_JSX_LINE_RE = re.compile(r'\s*</?[A-Z]')
+_CODE_OR_COMMENT_SPLIT_RE = re.compile(r'(`[^`]+`|\{/\*.*?\*/\})')
+_UNESC_OPEN_BRACE_RE = re.compile(r'(?<!\\)\{')
+_UNESC_CLOSE_BRACE_RE = re.compile(r'(?<!\\)\}')
+_CLOSING_TAG_RE = re.compile(r'/([a-zA-Z][a-zA-Z0-9]*)\s*>')
+_TAG_NAME_RE = re.compile(r'([a-zA-Z][a-zA-Z0-9]*)')
+_SELF_CLOSE_RE = re.compile(r'/\s*>')
+_JSX_COMMENT_RE = re.compile(r'\{/\*[\s\S]*?\*/\}')
+
+# Components in list items
+_COMPONENT_NAMES = ('Frame', 'Note', 'Info', 'Tip', 'Warning', 'Danger')
+_COMPONENT_OPEN_RE = re.compile(rf'^(\s+)<({"|".join(_COMPONENT_NAMES)})(\s|>|/>)')
+_COMPONENT_INLINE_RE = re.compile(rf'^(\s+)<({"|".join(_COMPONENT_NAMES)})\b[^>]*>.*</\2>')
+_LIST_START_RE = re.compile(r'^\s*(\d+\.\s|[-*]\s)')
+
+# Cleanup
+_LEADING_H1_RE = re.compile(r'^(\s*# .+\n)')
+_MONIKER_RANGE_LINE_RE = re.compile(r'monikerRange:.*\n')
+_ZONE_PIVOT_FM_RE = re.compile(r'zone_pivot_groups:.*\n')
+_NO_LOC_RE = re.compile(r':::no-loc\s+text="([^"]+)":::')
+_ROW_MARKER_RE = re.compile(r':::row:::\s*\n?')
+_ROW_END_MARKER_RE = re.compile(r':::row-end:::\s*\n?')
+_CUSTOMER_INTENT_RE = re.compile(r'#\s*customer intent:.*\n', re.IGNORECASE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_LIST_THEN_COMMENT_RE = re.compile(
+    r'(^[ \t]*(?:[-*+]|\d+\.)\s+.+\n)([ \t]*\{/\*)', re.MULTILINE
+)
+
+
+@lru_cache(maxsize=16384)
 def resolve_include_path(inc_ref: str, current_file: str) -> str | None:
-    """Resolve an include reference relative to current file."""
+    """Resolve an include reference relative to current file.
+
+    A handful of shared includes are referenced from hundreds of documents,
+    often via the same relative path, so the path arithmetic is memoized.
+    """
     current_dir = str(PurePosixPath(current_file).parent)
     combined = PurePosixPath(current_dir) / inc_ref
     parts = []
@@ -43,91 +197,105 @@ def resolve_include_path(inc_ref: str, current_file: str) -> str | None:
 
 def strip_include_front_matter(content: str) -> str:
     """Strip YAML front matter from include file content."""
-    fm_match = re.match(r'^---\s*\n.*?\n---\s*\n', content, re.DOTALL)
+    if not content.startswith('---'):
+        return content
+    fm_match = _INCLUDE_FM_RE.match(content[:_FRONT_MATTER_SCAN_BYTES])
     if fm_match:
         return content[fm_match.end():]
     return content
 
 
+# Lazy snapshot of every file under raw_docs: one directory walk replaces
+# an exists() stat syscall per include/code lookup (same pattern as the
+# pivot-titles cache below).
+_RAW_FILES: dict[str, Path] | None = None
+
+
+def _get_raw_files() -> dict[str, Path]:
+    global _RAW_FILES
+    if _RAW_FILES is None:
+        if RAW_DIR.is_dir():
+            _RAW_FILES = {
+                p.relative_to(RAW_DIR).as_posix(): p
+                for p in RAW_DIR.rglob("*")
+                if p.is_file()
+            }
+        else:
+            _RAW_FILES = {}
+    return _RAW_FILES
+
+
+@lru_cache(maxsize=4096)
 def read_include(inc_path: str) -> str:
-    """Read an include file from raw_docs, stripping its front matter."""
-    full_path = RAW_DIR / inc_path
-    if full_path.exists():
+    """Read an include file from raw_docs, stripping its front matter.
+
+    Cached: the popular includes are re-read for nearly every document, and
+    include files never change within a single conversion run.
+    """
+    full_path = _get_raw_files().get(inc_path)
+    if full_path is not None:
         content = full_path.read_text(encoding="utf-8", errors="replace").strip()
         return strip_include_front_matter(content)
     return ""
 
 
+@lru_cache(maxsize=4096)
+def _resolved_include_body(inc_path: str, depth: int) -> str:
+    """Read an include and resolve its nested includes, memoized.
+
+    The fully resolved body of an include is the same for every referrer at
+    a given depth, so each shared include is expanded once per run. Depth is
+    part of the key so the recursion limit stays exact for deep nests.
+    """
+    inc_content = read_include(inc_path)
+    if inc_content:
+        return resolve_includes(inc_content, inc_path, depth)
+    return ""
+
+
 def resolve_includes(content: str, source_path: str, depth: int = 0) -> str:
     """Recursively resolve [!INCLUDE] references."""
-    if depth > 5:
+    # Cheap literal probe before the regex: most documents have no includes,
+    # and a C-level substring scan beats a guaranteed-no-match regex pass.
+    # The same sentinel gate pattern guards each converter below.
+    if depth > 5 or '[!INCLUDE' not in content:
         return content
 
     def replace_include(match):
         inc_ref = match.group(2)
         resolved = resolve_include_path(inc_ref, source_path)
         if resolved:
-            inc_content = read_include(resolved)
-            if inc_content:
-                # Recursively resolve includes in the included content
-                return resolve_includes(inc_content, resolved, depth + 1)
+            return _resolved_include_body(resolved, depth + 1)
         return ""
 
-    return re.sub(
-        r'\[!INCLUDE\s+\[([^\]]*)\]\(([^)]+)\)\]',
-        replace_include,
-        content
-    )
+    return _INCLUDE_RE.sub(replace_include, content)
+
+
+# Single alternation covering every moniker form in one scan: the ':::'/'::: '
+# spacing variants are folded into ':::\s?' and the three supported ranges
+# into one capture group; the replacement decides drop vs keep per match.
+_MONIKER_RE = re.compile(
+    r':::\s?moniker\s+range="(foundry-classic \|\| foundry|foundry-classic|foundry)"'
+    r'\s*\n(.*?):::\s?moniker-end',
+    re.DOTALL,
+)
 
 
 def filter_monikers(content: str) -> str:
     """Keep 'foundry' moniker content, remove 'foundry-classic' blocks."""
-    # Handle :::moniker range="foundry-classic" ... :::moniker-end → remove
-    content = re.sub(
-        r':::moniker\s+range="foundry-classic"\s*\n(.*?):::moniker-end',
-        '',
-        content,
-        flags=re.DOTALL
-    )
-    # Handle ::: moniker range="foundry-classic" (with space)
-    content = re.sub(
-        r'::: moniker\s+range="foundry-classic"\s*\n(.*?)::: moniker-end',
-        '',
-        content,
-        flags=re.DOTALL
-    )
-    # Handle :::moniker range="foundry" ... :::moniker-end → keep content
-    content = re.sub(
-        r':::moniker\s+range="foundry"\s*\n(.*?):::moniker-end',
-        r'\1',
-        content,
-        flags=re.DOTALL
-    )
-    content = re.sub(
-        r'::: moniker\s+range="foundry"\s*\n(.*?)::: moniker-end',
-        r'\1',
-        content,
-        flags=re.DOTALL
-    )
-    # Handle combined monikers :::moniker range="foundry-classic || foundry"
-    content = re.sub(
-        r':::moniker\s+range="foundry-classic \|\| foundry"\s*\n(.*?):::moniker-end',
-        r'\1',
-        content,
-        flags=re.DOTALL
-    )
-    content = re.sub(
-        r'::: moniker\s+range="foundry-classic \|\| foundry"\s*\n(.*?)::: moniker-end',
-        r'\1',
+    if 'moniker' not in content:
+        return content
+    return _MONIKER_RE.sub(
+        lambda m: '' if m.group(1) == 'foundry-classic' else m.group(2),
         content,
-        flags=re.DOTALL
     )
-    return content
 
 
 def simplify_front_matter(content: str) -> tuple[str, dict]:
     """Extract and simplify YAML front matter."""
-    fm_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+    if not content.startswith('---'):
+        return content, {}
+    fm_match = _FRONT_MATTER_RE.match(content[:_FRONT_MATTER_SCAN_BYTES])
     if not fm_match:
         return content, {}
 
@@ -154,6 +322,8 @@ def simplify_front_matter(content: str) -> tuple[str, dict]:
 
 def convert_callouts(content: str) -> str:
     """Convert > [!TIP], > [!NOTE], > [!WARNING], > [!IMPORTANT], > [!CAUTION] to MDX callouts."""
+    if '[!' not in content:
+        return content
     callout_map = {
         "TIP": "Tip",
         "NOTE": "Note",
@@ -162,10 +332,6 @@ def convert_callouts(content: str) -> str:
         "CAUTION": "Danger",
     }
 
-    # Match > [!TYPE]\n> content lines (greedy within blockquote)
-    # Support optional leading whitespace for callouts inside list items
-    pattern = r'^([ \t]*)>\s*\[!(TIP|NOTE|WARNING|IMPORTANT|CAUTION)\]\s*\n((?:\1>.*\n?)*)'
-
     def replace_callout(match):
         indent = match.group(1)
         callout_type = match.group(2).upper()
@@ -178,96 +344,94 @@ def convert_callouts(content: str) -> str:
             # Strip the same indent level, then the > marker
             if line.startswith(indent):
                 line = line[len(indent):]
-            stripped = re.sub(r"^>\s?", "", line)
+            stripped = _BQ_MARKER_RE.sub("", line)
             lines.append(stripped)
         inner = "\n".join(lines).strip()
         return f"{indent}<{component}>\n{indent}\n{indent}{inner}\n{indent}\n{indent}</{component}>\n"
 
-    content = re.sub(pattern, replace_callout, content, flags=re.IGNORECASE | re.MULTILINE)
+    content = _CALLOUT_RE.sub(replace_callout, content)
     return content
 
 
-def convert_nextstep(content: str) -> str:
-    """Convert > [!div class="nextstepaction"] blocks to Mintlify Card links."""
-    def replace_nextstep(match):
-        block = re.sub(r'^>\s?', '', match.group(1), flags=re.MULTILINE).strip()
-        # Extract markdown links from the block
-        links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', block)
-        if links:
-            cards = []
-            for text, href in links:
-                cards.append(f'<Card title="{text}" icon="arrow-right" href="{href}" />')
-            return "\n".join(cards)
-        return block
-
-    content = re.sub(
-        r'>\s*\[!div\s+class="nextstepaction"\]\s*\n((?:>.*\n?)*)',
-        replace_nextstep,
-        content
-    )
-    return content
+def _div_nextstep(block: str) -> str:
+    """> [!div class="nextstepaction"] → Mintlify Card links."""
+    block = _BQ_MARKER_ML_RE.sub('', block).strip()
+    # Extract markdown links from the block
+    links = _MD_LINK_RE.findall(block)
+    if links:
+        cards = []
+        for text, href in links:
+            cards.append(f'<Card title="{text}" icon="arrow-right" href="{href}" />')
+        return "\n".join(cards)
+    return block
+
+
+def _div_checklist(block: str) -> str:
+    """> [!div class="checklist"] → markdown list."""
+    lines = []
+    for line in block.split("\n"):
+        stripped = _BQ_MARKER_RE.sub('', line).strip()
+        if stripped.startswith("* ") or stripped.startswith("- "):
+            item = stripped[2:].strip()
+            lines.append(f"- {item}")
+        elif stripped:
+            lines.append(stripped)
+    return "\n".join(lines)
 
 
-def convert_checklists(content: str) -> str:
-    """Convert > [!div class="checklist"] blocks to markdown lists."""
-    def replace_checklist(match):
-        block = match.group(1)
-        lines = []
-        for line in block.split("\n"):
-            stripped = re.sub(r'^>\s?', '', line).strip()
-            if stripped.startswith("* ") or stripped.startswith("- "):
-                item = stripped[2:].strip()
-                lines.append(f"- {item}")
-            elif stripped:
-                lines.append(stripped)
-        return "\n".join(lines)
-
-    content = re.sub(
-        r'>\s*\[!div\s+class="checklist"\]\s*\n((?:>.*\n?)*)',
-        replace_checklist,
-        content
-    )
-    return content
+def _div_single_selector(block: str) -> str:
+    """> [!div class="op_single_selector"] → Mintlify Tabs."""
+    tabs = []
+    for line in block.split("\n"):
+        stripped = _BQ_MARKER_RE.sub('', line).strip()
+        link_match = _SELECTOR_LINK_RE.match(stripped)
+        if link_match:
+            title = link_match.group(1)
+            href = link_match.group(2)
+            tabs.append(f'  <Tab title="{title}">\n    [{title}]({href})\n  </Tab>')
+    if tabs:
+        return "<Tabs>\n" + "\n".join(tabs) + "\n</Tabs>"
+    return ""
 
 
-def convert_selectors(content: str) -> str:
-    """Convert > [!div class="op_single_selector"] blocks to Mintlify Tabs."""
-    def replace_selector(match):
-        block = match.group(1)
-        tabs = []
-        for line in block.split("\n"):
-            stripped = re.sub(r'^>\s?', '', line).strip()
-            link_match = re.match(r'^-\s*\[([^\]]+)\]\(([^)]+)\)', stripped)
-            if link_match:
-                title = link_match.group(1)
-                href = link_match.group(2)
-                tabs.append(f'  <Tab title="{title}">\n    [{title}]({href})\n  </Tab>')
-        if tabs:
-            return "<Tabs>\n" + "\n".join(tabs) + "\n</Tabs>"
-        return ""
+def _div_unwrap(block: str) -> str:
+    """Multi-selector and mx-td* wrappers → plain content, > markers stripped."""
+    return _BQ_MARKER_ML_RE.sub('', block)
 
-    content = re.sub(
-        r'>\s*\[!div\s+class="op_single_selector"\]\s*\n((?:>.*\n?)*)',
-        replace_selector,
-        content
-    )
-    # Multi-selector — convert to plain links (no clean Mintlify mapping)
-    content = re.sub(
-        r'>\s*\[!div\s+class="op_multi_selector"[^\]]*\]\s*\n((?:>.*\n?)*)',
-        lambda m: re.sub(r'^>\s?', '', m.group(1), flags=re.MULTILINE),
-        content
+
+_DIV_HANDLERS = {
+    "nextstepaction": _div_nextstep,
+    "checklist": _div_checklist,
+    "op_single_selector": _div_single_selector,
+    "op_multi_selector": _div_unwrap,
+    "mx-td": _div_unwrap,
+}
+
+
+def convert_div_blocks(content: str) -> str:
+    """Convert every > [!div class="..."] blockquote form in one scan.
+
+    A single alternation replaces the former per-class passes; the callback
+    dispatches on the captured class name.
+    """
+    if '[!div' not in content:
+        return content
+    return _DIV_CLASS_RE.sub(
+        lambda m: _DIV_HANDLERS[m.group(1)](m.group(2)), content
     )
-    return content
 
 
 def convert_columns(content: str) -> str:
     """Convert :::row:::/:::column::: blocks to Mintlify Columns/Card layout."""
+    if ':::row' not in content:
+        return content
+
     # Count columns in each row to set cols attribute
     def replace_row(match):
         row_content = match.group(1)
         # Split by column markers
-        columns = re.split(r':::column[^:]*:::\s*\n?', row_content)
-        columns = [re.sub(r':::column-end:::\s*\n?', '', c).strip() for c in columns if c.strip()]
+        columns = _COLUMN_SPLIT_RE.split(row_content)
+        columns = [_COLUMN_END_RE.sub('', c).strip() for c in columns if c.strip()]
         if not columns:
             return ""
         n = len(columns)
@@ -278,22 +442,7 @@ def convert_columns(content: str) -> str:
             cards.append(f"<Card>\n\n{col}\n\n</Card>")
         return f'<Columns cols={{{n}}}>\n' + "\n".join(cards) + "\n</Columns>\n"
 
-    content = re.sub(
-        r':::row:::\s*\n(.*?):::row-end:::\s*\n?',
-        replace_row,
-        content,
-        flags=re.DOTALL,
-    )
-    return content
-
-
-def strip_table_wrappers(content: str) -> str:
-    """Strip [!div class="mx-tdBreakAll"] and similar table CSS wrappers."""
-    content = re.sub(
-        r'>\s*\[!div\s+class="mx-td[^"]*"\]\s*\n((?:>.*\n?)*)',
-        lambda m: re.sub(r'^>\s?', '', m.group(1), flags=re.MULTILINE),
-        content
-    )
+    content = _ROW_RE.sub(replace_row, content)
     return content
 
 
@@ -305,6 +454,8 @@ def normalize_markdown_tables(content: str) -> str:
     block as paragraph text. Normalize the delimiter cell count to the header
     cell count while preserving existing alignment markers where present.
     """
+    if '|' not in content:
+        return content
     parts = _split_code_and_comments(content)
     for i, part in enumerate(parts):
         if part.lstrip().startswith('```') or part.lstrip().startswith('~~~') or part.lstrip().startswith('{/*'):
@@ -312,15 +463,15 @@ def normalize_markdown_tables(content: str) -> str:
 
         lines = part.split('\n')
         for j in range(1, len(lines)):
-            delimiter_match = re.match(r'^(\s*)\|(.+)\|\s*$', lines[j])
+            delimiter_match = _TABLE_DELIM_ROW_RE.match(lines[j])
             if not delimiter_match:
                 continue
 
             delimiter_cells = [cell.strip() for cell in delimiter_match.group(2).split('|')]
-            if not delimiter_cells or not all(re.match(r'^:?-{3,}:?$', cell) for cell in delimiter_cells):
+            if not delimiter_cells or not all(_TABLE_DELIM_CELL_RE.match(cell) for cell in delimiter_cells):
                 continue
 
-            header_match = re.match(r'^\s*\|(.+)\|\s*$', lines[j - 1])
+            header_match = _TABLE_HEADER_ROW_RE.match(lines[j - 1])
             if not header_match:
                 continue
 
@@ -347,15 +498,18 @@ def convert_images(content: str) -> str:
     - type="icon" → <img ... /> (no alt, no frame)
     - lightbox → wraps in <Frame> (Mintlify supports zoom by default)
     """
+    if ':::image' not in content:
+        return content
+
     # First: handle complex images with long descriptions (multi-line :::image ... :::image-end:::)
     def replace_complex_image(match):
         tag = match.group(1)
         long_desc = match.group(2).strip()
-        source = re.search(r'source="([^"]+)"', tag)
-        alt = re.search(r'alt-text="([^"]+)"', tag)
+        source = _IMG_SOURCE_RE.search(tag)
+        alt = _IMG_ALT_RE.search(tag)
         src = source.group(1) if source else ""
         alt_text = alt.group(1) if alt else ""
-        src = re.sub(r'\?.*$', '', src)
+        src = _QUERY_STRING_RE.sub('', src)
         if src and not src.startswith("http"):
             src = f"/images/{PurePosixPath(src).name}"
         caption = long_desc.replace('"', '\\"') if long_desc else ""
@@ -363,22 +517,17 @@ def convert_images(content: str) -> str:
             return f'<Frame caption="{caption}">\n  <img src="{src}" alt="{alt_text}" />\n</Frame>'
         return f'<Frame>\n  <img src="{src}" alt="{alt_text}" />\n</Frame>'
 
-    content = re.sub(
-        r':::image\s+(.*?):::\s*\n(.*?):::image-end:::',
-        replace_complex_image,
-        content,
-        flags=re.DOTALL,
-    )
+    content = _COMPLEX_IMAGE_RE.sub(replace_complex_image, content)
 
     # Then: handle single-line :::image ... :::
     def replace_image(match):
         full = match.group(0)
-        img_type = re.search(r'type="([^"]+)"', full)
-        source = re.search(r'source="([^"]+)"', full)
-        alt = re.search(r'alt-text="([^"]+)"', full)
+        img_type = _IMG_TYPE_RE.search(full)
+        source = _IMG_SOURCE_RE.search(full)
+        alt = _IMG_ALT_RE.search(full)
         src = source.group(1) if source else ""
         alt_text = alt.group(1) if alt else ""
-        src = re.sub(r'\?.*$', '', src)
+        src = _QUERY_STRING_RE.sub('', src)
         if src and not src.startswith("http"):
             src = f"/images/{PurePosixPath(src).name}"
 
@@ -389,9 +538,7 @@ def convert_images(content: str) -> str:
         # Content and default: wrap in Frame
         return f'<Frame>\n  <img src="{src}" alt="{alt_text}" />\n</Frame>'
 
-    content = re.sub(
-        r':::image[^:]*?:::', replace_image, content, flags=re.DOTALL
-    )
+    content = _IMAGE_RE.sub(replace_image, content)
     return content
 
 
@@ -405,9 +552,12 @@ def rewrite_image_paths(content: str) -> str:
     def _rewrite_md_img(m):
         alt = m.group(1)
         path = m.group(2)
-        if path.startswith('http'):
+        # First-char dispatch: only paths starting 'h'/'~' can hit the
+        # special cases, so most paths skip both startswith calls.
+        first = path[:1]
+        if first == 'h' and path.startswith('http'):
             return m.group(0)
-        if path.startswith('~/reusable-content/'):
+        if first == '~' and path.startswith('~/reusable-content/'):
             # Map to /images/ai-services/filename.svg
             name = PurePosixPath(path).name
             return f'![{alt}](/images/ai-services/{name})'
@@ -417,7 +567,7 @@ def rewrite_image_paths(content: str) -> str:
         return f'![{alt}](/images/{name})'
 
     # Rewrite markdown images ![alt](path)
-    content = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', _rewrite_md_img, content)
+    content = _MD_IMAGE_RE.sub(_rewrite_md_img, content)
 
     def _rewrite_html_img(m):
         prefix = m.group(1)
@@ -430,17 +580,15 @@ def rewrite_image_paths(content: str) -> str:
         return f'{prefix}/images/{name}{suffix}'
 
     # Rewrite <img src="path"> with backslashes or relative paths
-    content = re.sub(
-        r'(<img\s[^>]*src=")([^"]+)(")',
-        _rewrite_html_img,
-        content,
-    )
+    content = _HTML_IMG_SRC_RE.sub(_rewrite_html_img, content)
 
     return content
 
 
 def convert_tabs(content: str) -> str:
     """Convert # [Tab Title](#tab/id) ... --- patterns to <Tabs>/<Tab> components."""
+    if '#tab/' not in content:
+        return content
     lines = content.split("\n")
     result = []
     i = 0
@@ -449,6 +597,20 @@ def convert_tabs(content: str) -> str:
     current_tab_title = ""
     tab_count = 0
 
+    def _emit_tab():
+        """Emit the current tab as one pre-joined block.
+
+        Appending a single joined body instead of one list entry per line
+        keeps `result` small (three entries per tab), so the final join
+        walks far fewer items on tab-heavy documents.
+        """
+        result.append(f'  <Tab title="{current_tab_title}">')
+        if current_tab_content:
+            result.append("\n".join(
+                f"    {line}" if line.strip() else "" for line in current_tab_content
+            ))
+        result.append("  </Tab>")
+
     def _close_tab_group():
         """Emit the current tab and close the <Tabs> group."""
         nonlocal in_tabs, current_tab_content, current_tab_title, tab_count
@@ -460,9 +622,7 @@ def convert_tabs(content: str) -> str:
                 break
             result.extend(current_tab_content)
         else:
-            result.append(f'  <Tab title="{current_tab_title}">')
-            result.extend(f"    {line}" if line.strip() else "" for line in current_tab_content)
-            result.append("  </Tab>")
+            _emit_tab()
             result.append("</Tabs>")
         in_tabs = False
         current_tab_content = []
@@ -472,8 +632,9 @@ def convert_tabs(content: str) -> str:
     while i < len(lines):
         line = lines[i]
 
-        # Check for tab header: # [Title](#tab/id)
-        tab_match = re.match(r'^#{1,6}\s+\[([^\]]+)\]\(#tab/([^)]+)\)\s*$', line)
+        # Check for tab header: # [Title](#tab/id). The substring probe skips
+        # the regex for the vast majority of lines.
+        tab_match = _TAB_HEADER_RE.match(line) if '](#tab/' in line else None
 
         if tab_match:
             tab_title = tab_match.group(1)
@@ -488,9 +649,7 @@ def convert_tabs(content: str) -> str:
             else:
                 # Close previous tab, start new one
                 tab_count += 1
-                result.append(f'  <Tab title="{current_tab_title}">')
-                result.extend(f"    {line}" if line.strip() else "" for line in current_tab_content)
-                result.append("  </Tab>")
+                _emit_tab()
                 current_tab_title = tab_title
                 current_tab_content = []
             i += 1
@@ -504,7 +663,7 @@ def convert_tabs(content: str) -> str:
 
         # Stop tab accumulation at JSX component boundaries to prevent spanning
         # across unrelated components.
-        if in_tabs and re.match(r'\s*</?(?:Tab|Tabs|ZonePivot|ZoneContent)\b', line):
+        if in_tabs and '<' in line and _JSX_BOUNDARY_RE.match(line):
             _close_tab_group()
             result.append(line)
             i += 1
@@ -577,6 +736,8 @@ def _get_pivot_titles() -> dict[str, str]:
 
 def convert_zone_pivots(content: str) -> str:
     """Convert :::zone pivot="..." blocks to page-level ZonePivot components."""
+    if ':::' not in content or 'zone' not in content:
+        return content
     PIVOT_TITLES = _get_pivot_titles()
 
     lines = content.split("\n")
@@ -595,7 +756,7 @@ def convert_zone_pivots(content: str) -> str:
 
     def group_id(zone_group: list[tuple[str, list[str]]]) -> str:
         raw_id = "__".join(sorted({pivot_name for pivot_name, _ in zone_group}))
-        return re.sub(r"[^a-zA-Z0-9_-]+", "-", raw_id).strip("-") or "default"
+        return _GROUP_ID_RE.sub("-", raw_id).strip("-") or "default"
 
     def emit_options(zone_group: list[tuple[str, list[str]]]) -> str:
         return json.dumps(
@@ -638,7 +799,8 @@ def convert_zone_pivots(content: str) -> str:
     i = 0
     while i < len(lines):
         line = lines[i]
-        zone_start = re.match(r':::\s*zone\s+pivot="([^"]+)"\s*$', line.strip())
+        # ':::' probe before strip+regex: zone markers are rare lines.
+        zone_start = _ZONE_START_RE.match(line.strip()) if ':::' in line else None
         if not zone_start:
             text_buffer.append(line)
             i += 1
@@ -648,14 +810,18 @@ def convert_zone_pivots(content: str) -> str:
         zone_group = []
 
         while i < len(lines):
-            zone_start = re.match(r':::\s*zone\s+pivot="([^"]+)"\s*$', lines[i].strip())
+            zone_start = (
+                _ZONE_START_RE.match(lines[i].strip()) if ':::' in lines[i] else None
+            )
             if not zone_start:
                 break
 
             pivot_name = zone_start.group(1)
             i += 1
             zone_content = []
-            while i < len(lines) and not re.match(r':::\s*zone-end\s*$', lines[i].strip()):
+            while i < len(lines) and not (
+                ':::' in lines[i] and _ZONE_END_RE.match(lines[i].strip())
+            ):
                 zone_content.append(lines[i])
                 i += 1
             if i < len(lines):
@@ -665,7 +831,7 @@ def convert_zone_pivots(content: str) -> str:
             j = i
             while j < len(lines) and not lines[j].strip():
                 j += 1
-            next_zone_start = re.match(r':::\s*zone\s+pivot="([^"]+)"\s*$', lines[j].strip()) if j < len(lines) else None
+            next_zone_start = _ZONE_START_RE.match(lines[j].strip()) if j < len(lines) else None
             current_pivot_names = {name for name, _ in zone_group}
             if next_zone_start and next_zone_start.group(1) not in current_pivot_names:
                 i = j
@@ -679,18 +845,11 @@ def convert_zone_pivots(content: str) -> str:
     flush_text()
 
     result = []
-    i = 0
-    while i < len(segments):
-        kind, value = segments[i]
+    for kind, value in segments:
         if kind == "text":
             result.extend(value)
-            i += 1
-            continue
-
-        zone_group = value
-        result.extend(emit_zone_components(zone_group))
-        i += 1
-
+        else:
+            result.extend(emit_zone_components(value))
     return "\n".join(result)
 
 
@@ -703,9 +862,17 @@ def add_zone_pivot_import(body: str) -> str:
     return 'import { ZoneContent, ZonePivot } from "/snippets/zone-pivot.jsx"\n\n' + body
 
 
+# Absolute Learn paths that get externalized to learn.microsoft.com; a
+# single startswith against the tuple replaces seven chained calls.
+_LEARN_PREFIXES = (
+    "/azure/", "/rest/", "/dotnet/", "/python/", "/javascript/", "/cli/", "/java/",
+)
+
+
 def rewrite_links(content: str, source_path: str) -> str:
     """Rewrite internal links and externalize cross-repo refs."""
-    def rewrite_link(match):
+    # Default-arg binding makes the per-link map lookup a local access.
+    def rewrite_link(match, _s2o=SOURCE_TO_OUTPUT):
         text = match.group(1)
         href = match.group(2)
 
@@ -713,18 +880,19 @@ def rewrite_links(content: str, source_path: str) -> str:
         href = href.replace('\\', '/')
 
         # Strip query params
-        clean_href = re.sub(r'\?.*$', '', href)
+        clean_href = _QUERY_STRING_RE.sub('', href)
 
         # External links - keep as-is
-        if clean_href.startswith("http://") or clean_href.startswith("https://"):
+        if clean_href.startswith(("http://", "https://")):
             return f"[{text}]({href})"
 
         # Empty links — keep text, drop the link
         if not clean_href or clean_href == "#":
             return text if text else match.group(0)
 
-        # Absolute /azure/... paths → learn.microsoft.com URLs
-        if clean_href.startswith("/azure/") or clean_href.startswith("/rest/") or clean_href.startswith("/dotnet/") or clean_href.startswith("/python/") or clean_href.startswith("/javascript/") or clean_href.startswith("/cli/") or clean_href.startswith("/java/"):
+        # Absolute /azure/... paths → learn.microsoft.com URLs. The '/'
+        # first-char check skips the tuple scan for relative hrefs.
+        if clean_href[0] == "/" and clean_href.startswith(_LEARN_PREFIXES):
             return f"[{text}](https://learn.microsoft.com{clean_href})"
 
         # Extract anchor if present
@@ -737,42 +905,42 @@ def rewrite_links(content: str, source_path: str) -> str:
         # Relative .md links → try to map to output path
         if path_part.endswith(".md"):
             resolved = resolve_include_path(path_part, source_path)
-            if resolved and resolved in SOURCE_TO_OUTPUT:
-                output = SOURCE_TO_OUTPUT[resolved]
+            if resolved and resolved in _s2o:
+                output = _s2o[resolved]
                 return f"[{text}](/{output}{anchor})"
 
             # Unresolved cross-repo paths → externalize to learn.microsoft.com
             # Matches: ../../foundry-classic/..., ../../../foundry-classic/...
-            cross_repo = re.match(r'^(?:\.\./)+(?:foundry-classic|ai-foundry|foundry)/(.*?)\.md$', path_part)
+            cross_repo = _CROSS_REPO_RE.match(path_part)
             if cross_repo:
                 relative = cross_repo.group(1)
                 repo_prefix = "foundry-classic" if "foundry-classic" in path_part else ("ai-foundry" if "ai-foundry" in path_part else "foundry")
                 return f"[{text}](https://learn.microsoft.com/en-us/azure/{repo_prefix}/{relative}{anchor})"
 
             # Any other unresolved .md link — strip extension for Mintlify
-            stripped = re.sub(r'\.md$', '', path_part)
+            stripped = _MD_EXT_RE.sub('', path_part)
             return f"[{text}]({stripped}{anchor})"
 
         return f"[{text}]({clean_href})"
 
     # Match markdown links [text](url) but not images ![text](url)
-    content = re.sub(r'(?<!!)\[([^\]]*)\]\(([^)]+)\)', rewrite_link, content)
+    content = _LINK_RE.sub(rewrite_link, content)
     return content
 
 
-CODE_SAMPLES_DIR = RAW_DIR / "code_samples"
-
-
 def resolve_code_includes(content: str) -> str:
     """Resolve :::code directives by inlining the actual source file content."""
+    if ':::code' not in content:
+        return content
+
     def replace_code_directive(match):
         indent = match.group(1)
         lang = match.group(2) or ""
         source = match.group(3)
         # source starts with ~/ — map to code_samples directory
         rel_path = source.lstrip("~/")
-        code_file = CODE_SAMPLES_DIR / rel_path
-        if code_file.exists():
+        code_file = _get_raw_files().get(f"code_samples/{rel_path}")
+        if code_file is not None:
             code = code_file.read_text(encoding="utf-8", errors="replace").strip()
         else:
             filename = PurePosixPath(rel_path).name
@@ -782,166 +950,172 @@ def resolve_code_includes(content: str) -> str:
         indented_code = '\n'.join(indent + line if line else line for line in code.split('\n'))
         return f"{indent}```{lang}\n{indented_code}\n{indent}```"
 
-    content = re.sub(
-        r'^([ \t]*):::code\s+language="(\w+)"\s+source="([^"]+)"(?:\s+[^:]*)?:*',
-        replace_code_directive,
-        content,
-        flags=re.MULTILINE,
-    )
+    content = _CODE_DIRECTIVE_RE.sub(replace_code_directive, content)
     return content
 
 
 def strip_code_includes(content: str) -> str:
     """Replace [!code-*] references with placeholder code blocks."""
+    if '[!code-' not in content:
+        return content
+
     def replace_code_include(match):
         lang = match.group(1) or ""
         path = match.group(2)
         filename = PurePosixPath(path).name
         return f"```{lang}\n// See: {filename}\n```"
 
-    content = re.sub(
-        r'\[!code-(\w+)\[.*?\]\(([^)]+)\)\]',
-        replace_code_include,
-        content
-    )
+    content = _CODE_INCLUDE_RE.sub(replace_code_include, content)
     return content
 
 
-def replace_html_comments(content: str) -> str:
+def _comments_in_prose(part: str) -> str:
     """Replace HTML comments <!-- ... --> with MDX-compatible {/* ... */}.
 
-    Skips content inside code fences to avoid mangling code examples.
     For multi-line comments, ensures all inner lines are indented to at
     least the same level as the opening {/* so they don't break list contexts.
     Strips JSX-like component tags from comment bodies to prevent MDX parse
     errors (e.g. unclosed <Tabs>/<Tab> inside a comment).
     """
-    parts = _split_code_and_comments(content)
-    for i, part in enumerate(parts):
-        if not (part.lstrip().startswith('```') or part.lstrip().startswith('~~~') or part.lstrip().startswith('{/*')):
-
-            def _convert_comment(m, _part=part):
-                inner = m.group(1)
-                # Strip JSX component tags that would confuse the MDX parser
-                inner = re.sub(r'</?[A-Z][a-zA-Z]*[^>]*/?>', '', inner)
-                # If nothing meaningful remains, emit a minimal comment
-                cleaned = inner.strip()
-                if not cleaned:
-                    return ''
-                if '\n' not in inner:
-                    return '{/*' + inner + '*/}'
-                # Detect indent of the <!-- from the part text
-                start = m.start()
-                line_start = _part.rfind('\n', 0, start) + 1
-                indent = ' ' * (start - line_start)
-                lines = inner.split('\n')
-                result_lines = [lines[0]]  # first line follows {/*
-                for line in lines[1:]:
-                    if line.strip() == '':
-                        result_lines.append('')
-                    elif len(line) - len(line.lstrip()) < len(indent):
-                        result_lines.append(indent + line.lstrip())
-                    else:
-                        result_lines.append(line)
-                # Ensure closing */} is indented to match opening {/*
-                # Remove trailing empty lines, then add indented closing
-                while result_lines and result_lines[-1].strip() == '':
-                    result_lines.pop()
-                return '{/*' + '\n'.join(result_lines) + '\n' + indent + '*/}'
-
-            parts[i] = re.sub(
-                r'<!--(.*?)-->',
-                _convert_comment,
-                part,
-                flags=re.DOTALL,
-            )
-    return ''.join(parts)
+    if '<!--' not in part:
+        return part
+
+    def _convert_comment(m, _part=part):
+        inner = m.group(1)
+        # Strip JSX component tags that would confuse the MDX parser
+        inner = _JSX_TAG_RE.sub('', inner)
+        # If nothing meaningful remains, emit a minimal comment
+        cleaned = inner.strip()
+        if not cleaned:
+            return ''
+        if '\n' not in inner:
+            return '{/*' + inner + '*/}'
+        # Detect indent of the <!-- from the part text
+        start = m.start()
+        line_start = _part.rfind('\n', 0, start) + 1
+        indent = ' ' * (start - line_start)
+        lines = inner.split('\n')
+        result_lines = [lines[0]]  # first line follows {/*
+        for line in lines[1:]:
+            if line.strip() == '':
+                result_lines.append('')
+            elif len(line) - len(line.lstrip()) < len(indent):
+                result_lines.append(indent + line.lstrip())
+            else:
+                result_lines.append(line)
+        # Ensure closing */} is indented to match opening {/*
+        # Remove trailing empty lines, then add indented closing
+        while result_lines and result_lines[-1].strip() == '':
+            result_lines.pop()
+        return '{/*' + '\n'.join(result_lines) + '\n' + indent + '*/}'
+
+    return _HTML_COMMENT_RE.sub(_convert_comment, part)
 
 
-def fix_void_elements(content: str) -> str:
+def _void_elements_in_prose(part: str) -> str:
     """Replace unclosed HTML void elements with self-closing form for MDX/JSX.
 
     Handles <br>, </br>, <hr> (case-insensitive) → <br />, <hr />.
-    Skips content inside fenced code blocks.
     """
-    parts = _split_code_and_comments(content)
-    for i, part in enumerate(parts):
-        if not (part.lstrip().startswith('```') or part.lstrip().startswith('~~~') or part.lstrip().startswith('{/*')):
-            # <br> or <br/> (without space) → <br /> ; also <BR>, <Br>, etc.
-            part = re.sub(r'<br\s*/?>', '<br />', part, flags=re.IGNORECASE)
-            # </br> → <br />
-            part = re.sub(r'</br\s*>', '<br />', part, flags=re.IGNORECASE)
-            # <hr> or <hr/> → <hr />
-            part = re.sub(r'<hr\s*/?>', '<hr />', part, flags=re.IGNORECASE)
-            # </hr> → <hr />
-            part = re.sub(r'</hr\s*>', '<hr />', part, flags=re.IGNORECASE)
-            # <sup/> → </sup> (malformed closing tag)
-            part = re.sub(r'<sup\s*/>', '</sup>', part, flags=re.IGNORECASE)
-            parts[i] = part
-    return ''.join(parts)
-
-
-def fix_html_in_tables(content: str) -> str:
+    if '<' not in part or not _VOID_PROBE_RE.search(part):
+        return part
+    # <br> or <br/> (without space) → <br /> ; also <BR>, <Br>, etc.
+    part = _BR_RE.sub('<br />', part)
+    # </br> → <br />
+    part = _BR_CLOSE_RE.sub('<br />', part)
+    # <hr> or <hr/> → <hr />
+    part = _HR_RE.sub('<hr />', part)
+    # </hr> → <hr />
+    part = _HR_CLOSE_RE.sub('<hr />', part)
+    # <sup/> → </sup> (malformed closing tag)
+    part = _SUP_SELF_CLOSE_RE.sub('</sup>', part)
+    return part
+
+
+def _html_tables_in_prose(part: str) -> str:
     """Fix HTML elements inside markdown table cells that break MDX parsing.
 
     1. Convert <ul><li>...</li></ul> in table rows to dash-separated items with <br />.
     2. Remove <Frame>...</Frame> wrappers in table rows, keeping inner content.
     """
-    parts = _split_code_and_comments(content)
-    for i, part in enumerate(parts):
-        if part.lstrip().startswith('```') or part.lstrip().startswith('~~~') or part.lstrip().startswith('{/*'):
+    if '|' not in part or '<' not in part:
+        return part
+    lines = part.split('\n')
+    # One pass marks the table rows, replacing two regex probes per line
+    # with a C-level lstrip/startswith check.
+    is_table_row = [ln.lstrip().startswith('|') for ln in lines]
+    for j, line in enumerate(lines):
+        # Only process markdown table rows
+        if not is_table_row[j]:
             continue
-        lines = part.split('\n')
-        for j, line in enumerate(lines):
-            # Only process markdown table rows
-            if not re.match(r'\s*\|', line):
-                continue
-            # Fix <ul><li>...</li></ul> → dash-separated items with <br />
-            def replace_ul(m):
-                items = re.findall(r'<li>(.*?)</li>', m.group(0), re.DOTALL)
-                return ' '.join(f'- {item.strip()}' if idx == 0
-                               else f'<br /> - {item.strip()}'
-                               for idx, item in enumerate(items))
-            line = re.sub(r'<ul>\s*(?:<li>.*?</li>\s*)+</ul>', replace_ul, line, flags=re.IGNORECASE)
-            # Also strip orphan list tags that weren't part of a complete <ul>...</ul>
-            line = re.sub(r'</?ul>', '', line, flags=re.IGNORECASE)
-            line = re.sub(r'<li>', '- ', line, flags=re.IGNORECASE)
-            line = re.sub(r'</li>', '', line, flags=re.IGNORECASE)
-            # Fix <ol> and list items similarly
-            line = re.sub(r'</?ol>', '', line, flags=re.IGNORECASE)
-            # Fix <Frame>...</Frame> → keep inner content only (in table rows)
-            line = re.sub(r'<Frame[^>]*>\s*', '', line, flags=re.IGNORECASE)
-            line = re.sub(r'\s*</Frame>', '', line, flags=re.IGNORECASE)
-            lines[j] = line
-        # Also strip <Frame>/</Frame> on ANY line between table rows
-        # (multi-line table cells have continuation lines without |)
-        in_table = False
-        for j, line in enumerate(lines):
-            if re.match(r'\s*\|', line):
-                in_table = True
-            elif in_table and line.strip() == '':
-                in_table = False
-            if in_table:
-                lines[j] = re.sub(r'<Frame[^>]*>', '', lines[j], flags=re.IGNORECASE)
-                lines[j] = re.sub(r'</Frame>', '', lines[j], flags=re.IGNORECASE)
-        parts[i] = '\n'.join(lines)
-    return ''.join(parts)
-
-
-def strip_orphan_tags(content: str) -> str:
-    """Remove orphan closing tags (</a>, </span>) that appear outside their opening context."""
+        # Fix <ul><li>...</li></ul> → dash-separated items with <br />
+        def replace_ul(m):
+            items = _LI_ITEM_RE.findall(m.group(0))
+            return ' '.join(f'- {item.strip()}' if idx == 0
+                           else f'<br /> - {item.strip()}'
+                           for idx, item in enumerate(items))
+        line = _UL_BLOCK_RE.sub(replace_ul, line)
+        # Also strip orphan list tags that weren't part of a complete <ul>...</ul>
+        line = _UL_TAG_RE.sub('', line)
+        line = _LI_OPEN_RE.sub('- ', line)
+        line = _LI_CLOSE_RE.sub('', line)
+        # Fix <ol> and list items similarly
+        line = _OL_TAG_RE.sub('', line)
+        # Fix <Frame>...</Frame> → keep inner content only (in table rows)
+        line = _FRAME_OPEN_WS_RE.sub('', line)
+        line = _FRAME_CLOSE_WS_RE.sub('', line)
+        lines[j] = line
+    # Also strip <Frame>/</Frame> on ANY line between table rows
+    # (multi-line table cells have continuation lines without |)
+    in_table = False
+    for j, line in enumerate(lines):
+        if is_table_row[j]:
+            in_table = True
+        elif in_table and line.strip() == '':
+            in_table = False
+        if in_table:
+            lines[j] = _FRAME_OPEN_RE.sub('', lines[j])
+            lines[j] = _FRAME_CLOSE_RE.sub('', lines[j])
+    return '\n'.join(lines)
+
+
+def _orphan_tags_in_prose(part: str) -> str:
+    """Remove orphan closing tags (</a>, </span>) outside their opening context."""
+    if '</a>' not in part and '</span>' not in part:
+        return part
+    lines = part.split('\n')
+    for j, line in enumerate(lines):
+        if '</a>' in line and '<a ' not in line and '<a>' not in line:
+            lines[j] = line.replace('</a>', '')
+        if '</span>' in line and '<span' not in line:
+            lines[j] = lines[j].replace('</span>', '')
+    return '\n'.join(lines)
+
+
+# Prose-only cleanup passes, applied in order over one code/comment split.
+_PROSE_TRANSFORMS = (
+    _comments_in_prose,
+    _void_elements_in_prose,
+    _html_tables_in_prose,
+    _orphan_tags_in_prose,
+)
+
+
+def _apply_to_prose(content: str, transforms=_PROSE_TRANSFORMS) -> str:
+    """Run the prose transforms over each non-code segment in one split.
+
+    The code-fence splitter used to run once per cleanup pass; splitting and
+    stitching once here quarters the bytes it scans per document. Code fences
+    and JSX comments pass through untouched, as before.
+    """
     parts = _split_code_and_comments(content)
     for i, part in enumerate(parts):
-        if part.lstrip().startswith('```') or part.lstrip().startswith('~~~') or part.lstrip().startswith('{/*'):
+        lead = part.lstrip()
+        if lead.startswith('```') or lead.startswith('~~~') or lead.startswith('{/*'):
             continue
-        # Remove </a> not preceded by <a on the same line
-        lines = part.split('\n')
-        for j, line in enumerate(lines):
-            if '</a>' in line and '<a ' not in line and '<a>' not in line:
-                lines[j] = line.replace('</a>', '')
-            if '</span>' in line and '<span' not in line:
-                lines[j] = lines[j].replace('</span>', '')
-        parts[i] = '\n'.join(lines)
+        for transform in transforms:
+            part = transform(part)
+        parts[i] = part
     return ''.join(parts)
 
 
@@ -952,9 +1126,12 @@ def tabs_to_codegroup(content: str) -> str:
     mixed content. When every <Tab> contains only a code fence (and maybe
     whitespace), replace the whole block with a <CodeGroup>.
     """
+    if '<Tabs>' not in content:
+        return content
+
     def replace_tabs_block(match):
         block = match.group(1)
-        tabs = re.findall(r'<Tab\s+title="([^"]+)">(.*?)</Tab>', block, re.DOTALL)
+        tabs = _TAB_ITEM_RE.findall(block)
         if not tabs:
             return match.group(0)
 
@@ -962,9 +1139,9 @@ def tabs_to_codegroup(content: str) -> str:
         for title, body in tabs:
             stripped = body.strip()
             # Extract all code fences
-            fences = re.findall(r'(```\w*[^\n]*\n.*?```)', stripped, re.DOTALL)
+            fences = _FENCE_FIND_RE.findall(stripped)
             # Check if body is ONLY code fences (allow whitespace between)
-            no_code = re.sub(r'```[\w]*[^\n]*\n.*?```', '', stripped, flags=re.DOTALL).strip()
+            no_code = _FENCE_STRIP_RE.sub('', stripped).strip()
             if no_code and len(no_code) > 20:
                 return match.group(0)  # mixed content, keep as Tabs
             if not fences:
@@ -974,7 +1151,7 @@ def tabs_to_codegroup(content: str) -> str:
                 # Inject title into fence if not already titled
                 first_line = fence.split('\n', 1)[0]
                 # e.g. ```python  or ```python title.py
-                lang_match = re.match(r'^```(\w+)(.*)', first_line)
+                lang_match = _FENCE_LANG_RE.match(first_line)
                 if lang_match:
                     lang = lang_match.group(1)
                     rest = lang_match.group(2).strip()
@@ -988,7 +1165,7 @@ def tabs_to_codegroup(content: str) -> str:
 
         return '<CodeGroup>\n' + '\n\n'.join(code_blocks) + '\n</CodeGroup>'
 
-    return re.sub(r'<Tabs>\s*(.*?)\s*</Tabs>', replace_tabs_block, content, flags=re.DOTALL)
+    return _TABS_BLOCK_RE.sub(replace_tabs_block, content)
 
 
 def fix_components_in_list_items(content: str) -> str:
@@ -998,11 +1175,9 @@ def fix_components_in_list_items(content: str) -> str:
     list items, MDX fails with 'Expected a closing tag before end of
     listItem'. Fix by de-indenting component blocks to top level.
     """
-    components = ('Frame', 'Note', 'Info', 'Tip', 'Warning', 'Danger')
-    comp_names = '|'.join(components)
-    open_re = re.compile(rf'^(\s+)<({comp_names})(\s|>|/>)')
-    inline_re = re.compile(rf'^(\s+)<({comp_names})\b[^>]*>.*</\2>')
-    list_start_re = re.compile(r'^\s*(\d+\.\s|[-*]\s)')
+    open_re = _COMPONENT_OPEN_RE
+    inline_re = _COMPONENT_INLINE_RE
+    list_start_re = _LIST_START_RE
 
     lines = content.split('\n')
     result = []
@@ -1126,7 +1301,7 @@ def _split_code_and_comments(content: str) -> list[str]:
             regions.append((m.start(), close_m.end()))
 
     # Find JSX comment blocks {/* ... */}
-    for m in re.finditer(r'\{/\*[\s\S]*?\*/\}', content):
+    for m in _JSX_COMMENT_RE.finditer(content):
         regions.append((m.start(), m.end()))
 
     # Sort by start and remove overlapping regions (keep earliest)
@@ -1154,7 +1329,7 @@ def _is_valid_tag_at(text: str, pos: int) -> bool:
         return False
     # Closing tag </tagname>
     if after[0] == '/':
-        m = re.match(r'/([a-zA-Z][a-zA-Z0-9]*)\s*>', after)
+        m = _CLOSING_TAG_RE.match(after)
         if m:
             tag = m.group(1)
             return tag[0].isupper() or tag.lower() in _KNOWN_HTML_TAGS
@@ -1163,7 +1338,7 @@ def _is_valid_tag_at(text: str, pos: int) -> bool:
     if after.startswith('!--'):
         return True
     # Opening/self-closing tag
-    m = re.match(r'([a-zA-Z][a-zA-Z0-9]*)', after)
+    m = _TAG_NAME_RE.match(after)
     if m:
         tag = m.group(1)
         rest = after[len(tag):]
@@ -1174,7 +1349,7 @@ def _is_valid_tag_at(text: str, pos: int) -> bool:
             return tag[0].isupper() or tag.lower() in _KNOWN_HTML_TAGS
         if first == '/':
             # Self-closing: must be /> (possibly with whitespace)
-            if re.match(r'/\s*>', rest):
+            if _SELF_CLOSE_RE.match(rest):
                 return tag[0].isupper() or tag.lower() in _KNOWN_HTML_TAGS
             return False
     return False
@@ -1193,16 +1368,16 @@ def escape_angle_brackets(content: str) -> str:
             continue
         lines = part.split('\n')
         for j, line in enumerate(lines):
-            segments = re.split(r'(`[^`]+`)', line)
+            segments = _INLINE_CODE_SPLIT_RE.split(line)
             for k, seg in enumerate(segments):
                 if seg.startswith('`'):
                     continue
                 # Convert autolinks <URL> to markdown links
-                seg = re.sub(r'(?<!\\)<(https?://[^>]+)>', r'[\1](\1)', seg)
+                seg = _AUTOLINK_RE.sub(r'[\1](\1)', seg)
                 # Escape bare < that aren't valid HTML/JSX tags
                 result = []
                 pos = 0
-                for m in re.finditer(r'(?<!\\)<', seg):
+                for m in _BARE_LT_RE.finditer(seg):
                     result.append(seg[pos:m.start()])
                     if _is_valid_tag_at(seg, m.start()):
                         result.append('<')
@@ -1229,15 +1404,15 @@ def escape_jsx_braces(content: str) -> str:
         lines = part.split('\n')
         for j, line in enumerate(lines):
             # Skip lines that are JSX/MDX component tags
-            if re.match(r'\s*</?[A-Z]', line):
+            if _JSX_LINE_RE.match(line):
                 continue
             # Split by inline code spans and JSX comments — skip those
-            segments = re.split(r'(`[^`]+`|\{/\*.*?\*/\})', line)
+            segments = _CODE_OR_COMMENT_SPLIT_RE.split(line)
             for k, seg in enumerate(segments):
                 if seg.startswith('`') or seg.startswith('{/*'):
                     continue
-                seg = re.sub(r'(?<!\\)\{', r'\\{', seg)
-                seg = re.sub(r'(?<!\\)\}', r'\\}', seg)
+                seg = _UNESC_OPEN_BRACE_RE.sub(r'\\{', seg)
+                seg = _UNESC_CLOSE_BRACE_RE.sub(r'\\}', seg)
                 segments[k] = seg
             lines[j] = ''.join(segments)
         parts[i] = '\n'.join(lines)
@@ -1257,7 +1432,7 @@ def strip_leading_h1(body: str, meta: dict) -> str:
         return body
 
     # Match the first H1 at the start of the body (allowing leading whitespace/newlines)
-    h1_match = re.match(r'^(\s*# .+\n)', body)
+    h1_match = _LEADING_H1_RE.match(body)
     if not h1_match:
         return body
 
@@ -1277,20 +1452,20 @@ def strip_leading_h1(body: str, meta: dict) -> str:
 def clean_up(content: str) -> str:
     """Final cleanup pass."""
     # Remove leftover moniker range from front matter comments
-    content = re.sub(r'monikerRange:.*\n', '', content)
+    content = _MONIKER_RANGE_LINE_RE.sub('', content)
     # Remove zone_pivot_groups from front matter (MS Learn-specific)
-    content = re.sub(r'zone_pivot_groups:.*\n', '', content)
+    content = _ZONE_PIVOT_FM_RE.sub('', content)
     # Remove :::no-loc directives
-    content = re.sub(r':::no-loc\s+text="([^"]+)":::', r'\1', content)
+    content = _NO_LOC_RE.sub(r'\1', content)
     # Remove any leftover :::row/:::column directives not caught by convert_columns
-    content = re.sub(r':::row:::\s*\n?', '', content)
-    content = re.sub(r':::row-end:::\s*\n?', '', content)
-    content = re.sub(r':::column[^:]*:::\s*\n?', '', content)
-    content = re.sub(r':::column-end:::\s*\n?', '', content)
+    content = _ROW_MARKER_RE.sub('', content)
+    content = _ROW_END_MARKER_RE.sub('', content)
+    content = _COLUMN_SPLIT_RE.sub('', content)
+    content = _COLUMN_END_RE.sub('', content)
     # Remove customer intent comments
-    content = re.sub(r'#\s*customer intent:.*\n', '', content, flags=re.IGNORECASE)
+    content = _CUSTOMER_INTENT_RE.sub('', content)
     # Collapse 3+ blank lines to 2
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    content = _BLANK_LINES_RE.sub('\n\n', content)
     return content.strip() + "\n"
 
 
@@ -1371,11 +1546,10 @@ def convert_doc(doc: dict) -> str | None:
     # Step 3: Simplify front matter
     body, meta = simplify_front_matter(content)
 
-    # Step 4: Convert callouts
+    # Step 4: Convert callouts and [!div class="..."] blocks
+    # (one pass covers nextstepaction, checklist, selectors, mx-td wrappers)
     body = convert_callouts(body)
-    body = convert_nextstep(body)
-    body = convert_checklists(body)
-    body = convert_selectors(body)
+    body = convert_div_blocks(body)
 
     # Step 5: Convert zone pivots (before tabs, so tab groups don't span across zone boundaries)
     body = convert_zone_pivots(body)
@@ -1401,31 +1575,16 @@ def convert_doc(doc: dict) -> str | None:
     # Step 11: Strip remaining [!code-*] includes
     body = strip_code_includes(body)
 
-    # Step 11: Strip table CSS wrappers
-    body = strip_table_wrappers(body)
-
     # Step 11b: Normalize malformed Markdown table delimiter rows
     body = normalize_markdown_tables(body)
 
-    # Step 12: Replace HTML comments with MDX-compatible JSX comments
-    body = replace_html_comments(body)
-
-    # Step 12b: Ensure JSX comments are separated from preceding list items
-    body = re.sub(
-        r'(^[ \t]*(?:[-*+]|\d+\.)\s+.+\n)([ \t]*\{/\*)',
-        r'\1\n\2',
-        body,
-        flags=re.MULTILINE,
-    )
-
-    # Step 13: Fix void HTML elements (<br>, <hr>) for MDX/JSX
-    body = fix_void_elements(body)
-
-    # Step 14: Fix HTML elements inside table cells (<ul><li>, <Frame>)
-    body = fix_html_in_tables(body)
+    # Steps 12-15: HTML comments → JSX comments, void elements (<br>, <hr>),
+    # HTML inside table cells, orphan closing tags — one code/comment split
+    # shared across all four prose passes
+    body = _apply_to_prose(body)
 
-    # Step 15: Strip orphan closing tags (</a>, </span>)
-    body = strip_orphan_tags(body)
+    # Step 15b: Ensure JSX comments are separated from preceding list items
+    body = _LIST_THEN_COMMENT_RE.sub(r'\1\n\2', body)
 
     # Step 16: Escape angle brackets that MDX misinterprets as JSX tags
     body = escape_angle_brackets(body)
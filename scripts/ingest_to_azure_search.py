@@ -7,7 +7,6 @@ Supports both the primary docs/ and docs-vnext/ content sets via CLI args.
 from __future__ import annotations
 
 import argparse
-import hashlib
 import os
 import time
 from pathlib import Path
@@ -26,10 +25,6 @@ def _require(name: str) -> str:
     return value
 
 
-def _content_hash(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Incrementally sync docs chunks to Azure AI Search")
     parser.add_argument("--recreate", action="store_true", help="Drop and recreate the index before ingest")
@@ -81,23 +76,12 @@ def main():
     )
     azure_index.create_index(recreate=args.recreate)
 
-    chunks = chunk_directory(docs_dir)
+    chunks = chunk_directory(docs_dir, as_records=True)
 
     def embed_batch(texts: list[str]) -> list[list[float]]:
         return foundry_client.embed_texts(texts)
 
-    records = {
-        chunk.chunk_id: {
-            "chunk_id": chunk.chunk_id,
-            "doc_path": chunk.doc_path,
-            "content_hash": _content_hash(chunk.content),
-            "title": chunk.title,
-            "section_heading": chunk.section_heading,
-            "description": chunk.description,
-            "content": chunk.content,
-        }
-        for chunk in chunks
-    }
+    records = {chunk["chunk_id"]: chunk for chunk in chunks}
 
     if args.recreate:
         to_upsert = list(records.values())
@@ -160,7 +144,7 @@ def main():
         foundry_client.close()
 
     duration = time.perf_counter() - started
-    docs = {chunk.doc_path for chunk in chunks}
+    docs = {chunk["doc_path"] for chunk in chunks}
     print(
         f"Ingest complete: docs={len(docs)} chunks={len(chunks)} "
         f"upserted={len(to_upsert)} deleted={len(to_delete)} "
@@ -170,8 +170,7 @@ class TestResources:
         async def check(client: Client) -> None:
             templates = await client.list_resource_templates()
             uri_templates = {t.uriTemplate for t in templates}
-            assert f"{prefix}page/{{section}}/{{page}}" in uri_templates
-            assert f"{prefix}page/{{section}}/{{subsection}}/{{page}}" in uri_templates
+            assert f"{prefix}page/{{path*}}" in uri_templates
 
         _run(_with_client(server, check))
 
@@ -14,6 +14,7 @@ from foundry_docs_mcp.retry import (
     is_retryable_exception,
     retry_after_seconds,
     with_retry,
+    with_retry_many,
 )
 
 
@@ -166,6 +167,41 @@ class TestWithRetry:
         assert fn.call_count == 1
 
 
+# ---------------------------------------------------------------------------
+# with_retry_many
+# ---------------------------------------------------------------------------
+
+class TestWithRetryMany:
+    def test_results_in_input_order(self):
+        fns = [MagicMock(return_value=i) for i in range(3)]
+        assert with_retry_many(fns, operation="test", max_attempts=3, base_delay_s=0.01) == [0, 1, 2]
+
+    def test_retries_only_failures(self):
+        ok = MagicMock(return_value="a")
+        flaky = MagicMock(side_effect=[ServiceRequestError("fail"), "b"])
+        result = with_retry_many(
+            [ok, flaky], operation="test", max_attempts=3, base_delay_s=0.01, max_delay_s=0.02,
+        )
+        assert result == ["a", "b"]
+        assert ok.call_count == 1
+        assert flaky.call_count == 2
+
+    def test_non_retryable_raises_immediately(self):
+        fns = [MagicMock(return_value="a"), MagicMock(side_effect=ValueError("nope"))]
+        with pytest.raises(ValueError):
+            with_retry_many(fns, operation="test", max_attempts=5, base_delay_s=0.01)
+        assert fns[1].call_count == 1
+
+    def test_raises_after_max_attempts(self):
+        fn = MagicMock(side_effect=ServiceRequestError("always fails"))
+        with pytest.raises(ServiceRequestError):
+            with_retry_many([fn], operation="test", max_attempts=2, base_delay_s=0.01, max_delay_s=0.02)
+        assert fn.call_count == 2
+
+    def test_empty_batch(self):
+        assert with_retry_many([], operation="test") == []
+
+
 # ---------------------------------------------------------------------------
 # AdaptiveThrottle
 # ---------------------------------------------------------------------------